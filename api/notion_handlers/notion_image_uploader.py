@@ -6,12 +6,48 @@ Uses the 'external_url' mode to have Notion fetch and store the image.
 import logging
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import unicodedata
 import re
 from .notion_config import NOTION_API_KEY, NOTION_VERSION
+from .rate_limiter import limiter, MAX_RETRIES, backoff_delay
 
 logger = logging.getLogger(__name__)
 
+# Endpoint for Notion File Uploads
+UPLOAD_ENDPOINT = "https://api.notion.com/v1/file_uploads"
+
+# Shared session so uploads reuse TLS connections to Notion (sized for the batch save pool)
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_session.headers.update({
+    "Authorization": f"Bearer {NOTION_API_KEY}",
+    "Notion-Version": NOTION_VERSION,
+    "Content-Type": "application/json"
+})
+
+def _post_with_retry(url, payload):
+    """
+    POSTs to Notion, retrying 429s only.
+    Creating a file upload is not idempotent, so this follows the same rule as
+    rate_limiter._is_retryable(..., idempotent=False): a 5xx may come back after the
+    upload was created, and the caller sees it as a failed upload instead.
+    Uses the same retry count and backoff as the rate_limit decorator.
+    """
+    for attempt in range(MAX_RETRIES):
+        limiter.acquire()
+        response = _session.post(url, json=payload)
+        if response.status_code != 429:
+            return response
+
+        wait_time = backoff_delay(response.headers, attempt)
+        logger.warning(f"⚠️ Notion upload returned {response.status_code}. Retrying in {wait_time:.1f}s...")
+        time.sleep(wait_time)
+
+    # Final attempt; caller raises on a non-2xx status
+    limiter.acquire()
+    return _session.post(url, json=payload)
+
 def sanitize_filename(text):
     """
     Sanitizes a string to be safe for filenames:
@@ -52,16 +88,6 @@ def upload_image_from_url(image_url: str, title: str = None) -> str:
     if not image_url:
         return None
 
-    # Endpoint for Notion File Uploads
-    upload_endpoint = "https://api.notion.com/v1/file_uploads"
-    
-    # Headers
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json"
-    }
-    
     # 1. Determine Filename
     # Extract extension from URL or default to jpg
     try:
@@ -94,7 +120,7 @@ def upload_image_from_url(image_url: str, title: str = None) -> str:
     try:
         # 2. Initiate Upload
         logger.info(f"Initiating Notion upload: {final_filename}")
-        response = requests.post(upload_endpoint, headers=headers, json=payload)
+        response = _post_with_retry(UPLOAD_ENDPOINT, payload)
         response.raise_for_status()
         
         data = response.json()
@@ -123,7 +149,8 @@ def upload_image_from_url(image_url: str, title: str = None) -> str:
             time.sleep(sleep_time)
             
             # Check status
-            check_resp = requests.get(f"{upload_endpoint}/{file_id}", headers=headers)
+            limiter.acquire()
+            check_resp = _session.get(f"{UPLOAD_ENDPOINT}/{file_id}")
             if check_resp.status_code == 200:
                 data = check_resp.json()
                 status = data.get("status")
@@ -5,6 +5,7 @@ Reusable across projects (recipes, transactions, etc)
 This module provides generic functions for creating pages in Notion data sources.
 It's completely project-agnostic - any project can import and use these functions.
 """
+import functools
 import logging
 import json
 from notion_handlers.notion_config import NOTION_API_KEY, NOTION_VERSION
@@ -30,16 +31,18 @@ def _log_debug_info(client, data_source_id):
     # logger.info(f"🎯 Target Data Source: {data_source_id}")
 
 
+@functools.lru_cache(maxsize=1)
 def get_notion_client():
     """
     Get initialized Notion client.
+    Cached so every call shares one client and its keep-alive connection pool.
     """
     return Client(
         auth=NOTION_API_KEY,
         notion_version=NOTION_VERSION
     )
 
-@rate_limit
+@rate_limit(idempotent=False)
 def create_page_in_data_source(data_source_id, properties, children=None, icon=None, cover=None):
     """
     Generic function to create a page in a Notion data source.
@@ -145,7 +148,7 @@ def update_page_properties(page_id, properties=None, cover=None, icon=None):
         logger.error(f"Error updating Notion page {page_id}: {e}")
         raise
 
-@rate_limit
+@rate_limit(idempotent=False)
 def append_block_children(block_id, children):
     """
     Appends block children to an existing block (or page).
@@ -162,6 +165,33 @@ def append_block_children(block_id, children):
         logger.error(f"Error appending blocks to {block_id}: {e}")
         raise
 
+@rate_limit
+def _list_block_children_page(block_id, start_cursor=None):
+    """One page (up to 100) of a block's children."""
+    try:
+        notion = get_notion_client()
+        params = {"block_id": block_id, "page_size": 100}
+        if start_cursor:
+            params["start_cursor"] = start_cursor
+        return notion.blocks.children.list(**params)
+    except Exception as e:
+        logger.error(f"Error listing children of {block_id}: {e}")
+        raise
+
+def list_block_children(block_id):
+    """
+    Returns every child block of a block (or page), following pagination.
+    Used to find the ids of blocks created as part of a page so more content can be appended under them.
+    """
+    results = []
+    start_cursor = None
+    while True:
+        response = _list_block_children_page(block_id, start_cursor)
+        results.extend(response.get("results", []))
+        if not response.get("has_more"):
+            return results
+        start_cursor = response.get("next_cursor")
+
 @rate_limit
 def archive_page(page_id):
     """
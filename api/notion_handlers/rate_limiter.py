@@ -1,61 +1,106 @@
 """
 Notion Rate Limiter
 Wraps API calls to ensure compliance with Notion's rate limits (approx 3 req/sec).
-Handles 429 Too Many Requests responses with exponential backoff.
+Retries 429 Too Many Requests with exponential backoff; timeouts and 5xx responses
+are retried as well for idempotent calls only.
 """
 import time
+import random
 import logging
 import functools
-from notion_client import APIResponseError
+import threading
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
 
 logger = logging.getLogger(__name__)
 
-# Token bucket settings
-MAX_TOKENS = 3.0
-REFILL_RATE = 3.0  # tokens per second
-tokens = MAX_TOKENS
-last_refill = time.time()
-
-def _wait_for_token():
-    """Simple token bucket implementation to rate limit requests locally."""
-    global tokens, last_refill
-    while True:
-        now = time.time()
-        # Refill tokens based on time elapsed
-        elapsed = now - last_refill
-        if elapsed > 0:
-            tokens = min(MAX_TOKENS, tokens + elapsed * REFILL_RATE)
-            last_refill = now
-        
-        if tokens >= 1.0:
-            tokens -= 1.0
-            return
-        
-        # Wait a bit before checking again
-        time.sleep(0.1)
+# Retry settings
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5  # seconds, doubled per attempt
+BACKOFF_MAX = 10.0
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    Allows bursts of up to `capacity` calls, then `rate` calls per second on average.
+    """
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available, then takes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                # Sleep just long enough for the next token, outside the lock
+                wait_time = (1.0 - self._tokens) / self.rate
+
+            time.sleep(wait_time)
+
+# Shared by every Notion call in the process; kept under Notion's ~3 req/sec average
+limiter = TokenBucket(rate=2.5, capacity=5)
+
+def _is_retryable(e, idempotent=True):
+    """
+    429s are always safe to retry: Notion rejected the request without acting on it.
+    Timeouts and 5xx responses may arrive after the write landed, so they are only
+    retried for idempotent calls; other 4xx are never retried.
+    """
+    status = getattr(e, "status", None)
+    if status == 429:
+        return True
+    if not idempotent:
+        return False
+    return isinstance(e, RequestTimeoutError) or (status is not None and status >= 500)
+
+def backoff_delay(headers, attempt):
+    """
+    Honours Retry-After when Notion sends it, else exponential backoff with jitter.
+    Shared by every Notion retry loop in this package so they follow one policy.
+    """
+    retry_after = headers and headers.get("Retry-After")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)) + random.uniform(0, BACKOFF_BASE)
+
+def rate_limit(func=None, *, idempotent=True):
+    """
+    Decorator to apply rate limiting and 429/5xx retry logic.
+    Use @rate_limit(idempotent=False) for calls that create content (page creates,
+    block appends) so a timed-out request that actually succeeded isn't sent twice.
+    """
+    if func is None:
+        return functools.partial(rate_limit, idempotent=idempotent)
 
-def rate_limit(func):
-    """Decorator to apply rate limiting and 429 retry logic."""
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        # 1. Local Rate Limiting
-        _wait_for_token()
-        
-        # 2. API Error Handling (429)
-        max_retries = 5
-        for attempt in range(max_retries):
+        for attempt in range(MAX_RETRIES):
+            # 1. Local Rate Limiting (retries spend a token too)
+            limiter.acquire()
+
+            # 2. API Error Handling (429 / 5xx)
             try:
                 return func(*args, **kwargs)
-            except APIResponseError as e:
-                if e.code == 429: # Too Many Requests
-                    # Notion usually provides a Retry-After header
-                    retry_after = int(e.headers.get("Retry-After", 1))
-                    wait_time = retry_after + (attempt * 1) # Add slight jitter
-                    logger.warning(f"⚠️ Rate limited by Notion. Waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    raise e
+            except (HTTPResponseError, RequestTimeoutError) as e:
+                if not _is_retryable(e, idempotent):
+                    raise
+                wait_time = backoff_delay(getattr(e, "headers", None), attempt)
+                logger.warning(f"⚠️ Notion request failed ({getattr(e, 'status', 'timeout')}). Retrying in {wait_time:.1f}s...")
+                time.sleep(wait_time)
         
         # Final attempt
+        limiter.acquire()
         return func(*args, **kwargs)
-    return wrapper
\ No newline at end of file
+    return wrapper
@@ -9,6 +9,7 @@ Request body: {"url": "https://www.waitrose.com/..."}
 Response: Recipe data in frontend JSON format
 """
 
+import asyncio
 import logging
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
@@ -57,8 +58,9 @@ async def parse_waitrose(request: WaitroseUrl):
     logger.info(f"API call: POST /api/recipe/parse-waitrose for URL: {request.url}")
     
     try:
-        # Process the Waitrose URL (parse only, no upload)
-        status_code, response_data = process_waitrose_recipe(request.url)
+        # Process the Waitrose URL (parse only, no upload).
+        # The fetch and parse are blocking, so run them off the event loop.
+        status_code, response_data = await asyncio.to_thread(process_waitrose_recipe, request.url)
         
         # If processing failed, raise HTTP exception
         if status_code != 200:
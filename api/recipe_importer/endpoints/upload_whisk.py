@@ -19,6 +19,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scripts.whisk_handler import upload_recipe_to_whisk
 from scripts.recipe_notion_adapter import save_recipe_to_notion
+from scripts.recipe_sync_tracker import flush_tracker
 
 # Import Config
 # We need to go up two levels to get to api/notion_handlers
@@ -71,6 +72,7 @@ async def upload_whisk(recipe: RecipeUpload):
             try:
                 if whisk_id != "unknown":
                     save_recipe_to_notion(recipe_data, whisk_id)
+                    flush_tracker()
                     logger.info("[Recipe Importer]   -> ✅ Notion save complete!")
                 else:
                     logger.warning("  -> Skipping Notion save: Could not retrieve Whisk ID from response")
@@ -2,13 +2,14 @@
 Email Notifier for Recipe Sync
 Generates and sends HTML reports for sync results.
 """
+import io
 import os
 import smtplib
+import functools
 import logging
-import base64
 from pathlib import Path
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
+from email.policy import SMTP
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -38,29 +39,37 @@ COLOR_ERROR = "#ef4444"    # var(--destructive)
 COLOR_WARNING = "#F8A310"  # var(--warning) hsl(38 95% 52%) -> Calculated Hex
 
 # Inline SVG Definitions (Lucide Icons equivalent)
-def get_svg_icon(name, color):
-    if name == "triangle-alert":
-        return f"""
+_SVG_TEMPLATES = {
+    "triangle-alert": """
         <svg xmlns="http://www.w3.org/2000/svg" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="vertical-align: text-bottom; margin-right: 8px;">
             <path d="m21.73 18-8-14a2 2 0 0 0-3.48 0l-8 14A2 2 0 0 0 4 21h16a2 2 0 0 0 1.73-3Z"/>
             <path d="M12 9v4"/>
             <path d="M12 17h.01"/>
         </svg>
-        """
-    elif name == "circle-x":
-        return f"""
+        """,
+    "circle-x": """
         <svg xmlns="http://www.w3.org/2000/svg" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="vertical-align: text-bottom; margin-right: 8px;">
             <circle cx="12" cy="12" r="10"/>
             <path d="m15 9-6 6"/>
             <path d="m9 9 6 6"/>
         </svg>
-        """
-    return ""
+        """,
+}
+
+@functools.lru_cache(maxsize=16)
+def get_svg_icon(name, color):
+    template = _SVG_TEMPLATES.get(name)
+    return template.format(color=color) if template else ""
+
+# Content-ID used to reference the crest attached to the email
+LOGO_CID = "broomfield-crest"
 
-def get_logo_base64():
+@functools.lru_cache(maxsize=1)
+def get_logo_bytes():
     """
-    Reads the local Broomfield crest image and returns a base64 string.
+    Reads the local Broomfield crest image and returns the raw PNG bytes.
     Path is relative to this script: ../../../src/assets/broomfield-crest.png
+    Loaded lazily on the first report and kept for the life of the process.
     """
     try:
         # Resolve path: api/recipe_importer/scripts/ -> src/assets/
@@ -68,94 +77,113 @@ def get_logo_base64():
         logo_path = current_dir.parent.parent.parent / "src" / "assets" / "broomfield-crest.png"
         
         if logo_path.exists():
-            with open(logo_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-                return f"data:image/png;base64,{encoded_string}"
+            return logo_path.read_bytes()
     except Exception as e:
         logger.warning(f"Failed to load logo image: {e}")
     return None
 
-def generate_email_html(stats, rejections, errors):
-    """Generates the modern HTML email body."""
+def render_item_row(buf, title, detail, link=None, is_error=False):
+    """Writes a single rejection/error card into the buffer."""
+    # Red for error, Orange for rejection
+    bar_color = COLOR_ERROR if is_error else COLOR_WARNING 
+    
+    # Only show button if there is a link AND it is NOT an error
+    action_button = ""
+    if link and not is_error:
+        action_button = f"""
+        <a href="{link}" style="background-color: {COLOR_PRIMARY}; color: #ffffff; padding: 8px 16px; border-radius: 6px; text-decoration: none; font-size: 12px; font-weight: 600; white-space: nowrap;">Fix on Whisk &rarr;</a>
+        """
+
+    # Flex layout: Text on left, Button on right, Vertically centered
+    buf.write(f"""
+    <div style="background-color: {COLOR_CARD}; border: 1px solid {COLOR_BORDER}; border-left: 4px solid {bar_color}; border-radius: 6px; padding: 16px; margin-bottom: 12px; box-shadow: 0 1px 2px rgba(0,0,0,0.05);">
+        <div style="display: flex; align-items: center; justify-content: space-between;">
+            <div style="flex: 1; padding-right: 16px;">
+                <h4 style="margin: 0 0 4px 0; font-size: 15px; font-weight: 600; color: {COLOR_TEXT};">{title}</h4>
+                <p style="margin: 0; font-size: 13px; color: {COLOR_MUTED}; line-height: 1.4;">{detail}</p>
+            </div>
+            <div style="flex-shrink: 0;">
+                {action_button}
+            </div>
+        </div>
+    </div>
+    """)
+
+def _render_success_report(created, updated, timestamp, logo_cid=None):
+    """
+    Compact body for a run with nothing to report.
+    """
+    logo_html = f'<img src="cid:{logo_cid}" alt="Broomfield Crest" width="120" style="display: block; margin: 0 auto 20px auto; width: 120px; height: auto;">' if logo_cid else ""
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="utf-8">
+        <title>Recipe Sync Report</title>
+    </head>
+    <body style="margin: 0; padding: 20px 0; background-color: {COLOR_BG}; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; color: {COLOR_TEXT};">
+        <div style="max-width: 600px; margin: 0 auto; text-align: center;">
+            {logo_html}
+            <div style="background-color: {COLOR_CARD}; border-radius: 12px; border: 1px solid {COLOR_BORDER}; padding: 30px 40px;">
+                <h1 style="margin: 0; font-size: 22px; color: {COLOR_PRIMARY}; font-weight: 700;">Whisk Recipe Sync Report</h1>
+                <p style="margin: 6px 0 0 0; color: {COLOR_MUTED}; font-size: 13px;">{timestamp}</p>
+                <p style="margin: 20px 0 0 0; font-size: 14px; color: {COLOR_TEXT};">Created: <strong>{created}</strong> &nbsp;•&nbsp; Updated: <strong>{updated}</strong></p>
+                <div style="padding: 20px 0 0 0; color: {COLOR_MUTED}; font-size: 14px;">All recipes synced successfully. No issues found.</div>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+def generate_email_html(stats, rejections, errors, logo_cid=None):
+    """
+    Generates the modern HTML email body.
+    logo_cid references the crest attached as a related MIME part (omitted if None).
+    """
+    timestamp = datetime.now().strftime('%B %d, %Y • %H:%M')
+
+    # Happy path: skip the stats table and issue sections entirely
+    if not rejections and not errors:
+        return _render_success_report(stats.get('created', 0), stats.get('updated', 0), timestamp, logo_cid)
     
-    logo_src = get_logo_base64()
     logo_html = ""
-    if logo_src:
+    if logo_cid:
         logo_html = f"""
         <tr>
             <td align="center" style="padding-bottom: 20px;">
-                <img src="{logo_src}" alt="Broomfield Crest" width="120" style="display: block; width: 120px; height: auto;">
+                <img src="cid:{logo_cid}" alt="Broomfield Crest" width="120" style="display: block; width: 120px; height: auto;">
             </td>
         </tr>
         """
     
-    # Helper for rendering list items
-    def render_item_row(title, detail, link=None, is_error=False):
-        # Red for error, Orange for rejection
-        bar_color = COLOR_ERROR if is_error else COLOR_WARNING 
-        
-        # Only show button if there is a link AND it is NOT an error
-        action_button = ""
-        if link and not is_error:
-            action_button = f"""
-            <a href="{link}" style="background-color: {COLOR_PRIMARY}; color: #ffffff; padding: 8px 16px; border-radius: 6px; text-decoration: none; font-size: 12px; font-weight: 600; white-space: nowrap;">Fix on Whisk &rarr;</a>
-            """
-
-        # Flex layout: Text on left, Button on right, Vertically centered
-        return f"""
-        <div style="background-color: {COLOR_CARD}; border: 1px solid {COLOR_BORDER}; border-left: 4px solid {bar_color}; border-radius: 6px; padding: 16px; margin-bottom: 12px; box-shadow: 0 1px 2px rgba(0,0,0,0.05);">
-            <div style="display: flex; align-items: center; justify-content: space-between;">
-                <div style="flex: 1; padding-right: 16px;">
-                    <h4 style="margin: 0 0 4px 0; font-size: 15px; font-weight: 600; color: {COLOR_TEXT};">{title}</h4>
-                    <p style="margin: 0; font-size: 13px; color: {COLOR_MUTED}; line-height: 1.4;">{detail}</p>
-                </div>
-                <div style="flex-shrink: 0;">
-                    {action_button}
-                </div>
-            </div>
-        </div>
-        """
-
-    # Build Rejection Sections
-    rejection_html = ""
-    if rejections:
-        icon_svg = get_svg_icon("triangle-alert", COLOR_WARNING)
-        rows = "".join([
-            render_item_row(
-                item['name'], 
-                f"Reason: {item['reason']}", 
-                f"https://app.samsungfood.com/recipes/{item['id']}/edit" if item.get('id') else None
-            ) for item in rejections
-        ])
-        rejection_html = f"""
+    # Build Issue Sections (Rejections, then Errors) into a single buffer
+    # Each entry: (heading, icon, icon color, items, detail label, detail key, link suffix, is_error)
+    sections = (
+        ("Recipes Rejected", "triangle-alert", COLOR_WARNING, rejections, "Reason", "reason", "/edit", False),
+        ("System Errors", "circle-x", COLOR_ERROR, errors, "Error", "error", "", True),
+    )
+    buf = io.StringIO()
+    for heading, icon, color, items, label, key, link_suffix, is_error in sections:
+        if not items:
+            continue
+        buf.write(f"""
         <div style="margin-top: 30px;">
             <h3 style="color: {COLOR_TEXT}; font-size: 16px; border-bottom: 2px solid {COLOR_BORDER}; padding-bottom: 8px; margin-bottom: 16px; display: flex; align-items: center;">
-                {icon_svg} Recipes Rejected
+                {get_svg_icon(icon, color)} {heading}
             </h3>
-            {rows}
-        </div>
-        """
-
-    # Build Error Sections
-    error_html = ""
-    if errors:
-        icon_svg = get_svg_icon("circle-x", COLOR_ERROR)
-        rows = "".join([
+        """)
+        for item in items:
             render_item_row(
-                item['name'], 
-                f"Error: {item['error']}", 
-                f"https://app.samsungfood.com/recipes/{item['id']}" if item.get('id') else None,
-                is_error=True
-            ) for item in errors
-        ])
-        error_html = f"""
-        <div style="margin-top: 30px;">
-            <h3 style="color: {COLOR_TEXT}; font-size: 16px; border-bottom: 2px solid {COLOR_BORDER}; padding-bottom: 8px; margin-bottom: 16px; display: flex; align-items: center;">
-                {icon_svg} System Errors
-            </h3>
-            {rows}
+                buf,
+                item['name'],
+                f"{label}: {item[key]}",
+                f"https://app.samsungfood.com/recipes/{item['id']}{link_suffix}" if item.get('id') else None,
+                is_error=is_error
+            )
+        buf.write("""
         </div>
-        """
+        """)
+    sections_html = buf.getvalue()
 
     # Main Template
     return f"""
@@ -180,7 +208,7 @@ def generate_email_html(stats, rejections, errors):
                                     <tr>
                                         <td style="padding: 30px 40px; background-color: {COLOR_CARD}; border-bottom: 1px solid {COLOR_BORDER}; text-align: center;">
                                             <h1 style="margin: 0; font-size: 22px; color: {COLOR_PRIMARY}; font-weight: 700;">Whisk Recipe Sync Report</h1>
-                                            <p style="margin: 6px 0 0 0; color: {COLOR_MUTED}; font-size: 13px;">{datetime.now().strftime('%B %d, %Y • %H:%M')}</p>
+                                            <p style="margin: 6px 0 0 0; color: {COLOR_MUTED}; font-size: 13px;">{timestamp}</p>
                                         </td>
                                     </tr>
 
@@ -207,10 +235,7 @@ def generate_email_html(stats, rejections, errors):
                                                 </tr>
                                             </table>
 
-                                            {rejection_html}
-                                            {error_html}
-
-                                            {'<div style="text-align:center; padding: 30px 0; color: ' + COLOR_MUTED + '; font-size: 14px;">All recipes synced successfully. No issues found.</div>' if not rejections and not errors else ''}
+                                            {sections_html}
                                         </td>
                                     </tr>
                                     
@@ -249,15 +274,19 @@ def send_sync_report(stats):
     logger.info(f"📭 Sending sync report (Rejections: {len(rejections)}, Errors: {len(errors)})...")
 
     subject = f"Whisk Recipe Sync Alert: {len(rejections)} Rejected, {len(errors)} Errors"
-    html_body = generate_email_html(stats, rejections, errors)
+    logo_bytes = get_logo_bytes()
+    html_body = generate_email_html(stats, rejections, errors, logo_cid=LOGO_CID if logo_bytes else None)
 
     try:
-        msg = MIMEMultipart('alternative')
+        # Quoted-printable keeps the mostly-ASCII HTML close to its original size (base64 adds ~33%)
+        msg = EmailMessage(policy=SMTP)
         msg['Subject'] = subject
         msg['From'] = SMTP_FROM_EMAIL
         msg['To'] = SMTP_TO_EMAIL
 
-        msg.attach(MIMEText(html_body, 'html'))
+        msg.set_content(html_body, subtype='html', cte='quoted-printable')
+        if logo_bytes:
+            msg.add_related(logo_bytes, maintype='image', subtype='png', cid=f"<{LOGO_CID}>")
 
         with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
             server.starttls()
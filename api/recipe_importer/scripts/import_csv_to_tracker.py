@@ -4,6 +4,7 @@ One-off script to populate sync_status.json from an existing CSV export.
 """
 import csv
 import json
+import os
 import re
 import unicodedata
 import logging
@@ -45,52 +46,72 @@ def sanitize_filename(text):
     
     return text or "unknown-recipe"
 
+# CSV values treated as a ticked checkbox (Notion exports checkboxes as "Yes"/"No")
+_TRUE_VALUES = frozenset({"true", "yes", "1", "t", "y"})
+
 def str_to_bool(val):
     """Converts CSV string boolean to Python boolean."""
-    if not val:
-        return False
-    return val.lower().strip() == "true"
+    return bool(val) and val.strip().lower() in _TRUE_VALUES
 
 def import_csv():
     if not CSV_FILE.exists():
         logger.error(f"❌ CSV file not found at: {CSV_FILE}")
         return
 
-    tracker_data = {}
     count = 0
 
     logger.info(f"Reading from: {CSV_FILE}")
 
-    with open(CSV_FILE, 'r', encoding='utf-8-sig') as f: # utf-8-sig handles BOM if present
-        reader = csv.DictReader(f)
+    # Records are streamed to a temp file as they are parsed (same layout as json.dump indent=2),
+    # then swapped into place so a failed import never leaves a half-written tracker.
+    tmp_file = TRACKER_FILE.with_suffix('.json.tmp')
+
+    with open(CSV_FILE, 'r', encoding='utf-8-sig') as f, open(tmp_file, 'w') as out: # utf-8-sig handles BOM if present
+        out.write("{")
+        reader = csv.reader(f)
         
-        # Normalize headers (strip whitespace)
-        reader.fieldnames = [name.strip() for name in reader.fieldnames]
+        # Normalize headers (strip whitespace) and resolve column positions once
+        header = [name.strip() for name in next(reader, [])]
+        ix = {name: pos for pos, name in enumerate(header)}
+        width = len(header)
+
+        whisk_ix = ix.get("Whisk Id")
+        notion_ix = ix.get("Notion Id")
+        title_ix = ix.get("Title")
+        video_ix = ix.get("Video?")
+        made_ix = ix.get("Made?")
+        photos_ix = ix.get("Instruction Photos")
+        image_type_ix = ix.get("Image Type")
         
         for row in reader:
             try:
-                whisk_id = row.get("Whisk Id")
-                notion_id = row.get("Notion Id")
-                title_raw = row.get("Title")
+                # Pad short rows (DictReader fills missing fields with None)
+                if len(row) < width:
+                    row += [None] * (width - len(row))
+
+                whisk_id = row[whisk_ix] if whisk_ix is not None else None
+                notion_id = row[notion_ix] if notion_ix is not None else None
+                title_raw = row[title_ix] if title_ix is not None else None
                 
                 if not whisk_id or not notion_id:
                     logger.warning(f"Skipping row with missing IDs: {row}")
                     continue
 
                 # Parse Booleans
-                has_video = str_to_bool(row.get("Video?"))
-                was_made = str_to_bool(row.get("Made?"))
-                has_inst_photos = str_to_bool(row.get("Instruction Photos"))
+                has_video = str_to_bool(row[video_ix]) if video_ix is not None else False
+                was_made = str_to_bool(row[made_ix]) if made_ix is not None else False
+                has_inst_photos = str_to_bool(row[photos_ix]) if photos_ix is not None else False
                 
                 # Sanitise Title
                 clean_title = sanitize_filename(title_raw)
 
                 # Build Record
+                image_type = row[image_type_ix] if image_type_ix is not None else "external" # Default to external if missing
                 record = {
                     "whisk_recipe_id": whisk_id,
                     "notion_page_id": notion_id,
                     "recipe_title": clean_title,
-                    "image_type": row.get("Image Type", "external").lower(), # Default to external if missing
+                    "image_type": image_type.lower(),
                     "recipe_video": has_video,
                     "instruction_photos": has_inst_photos,
                     "was_made": was_made,
@@ -98,15 +119,17 @@ def import_csv():
                     "last_synced": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 }
 
-                tracker_data[whisk_id] = record
+                # Duplicate Whisk Ids are written again; json.load keeps the last one, as the dict did
+                record_json = json.dumps(record, indent=2).replace("\n", "\n  ")
+                out.write(f"{',' if count else ''}\n  {json.dumps(whisk_id)}: {record_json}")
                 count += 1
                 
             except Exception as e:
                 logger.error(f"Error processing row {row}: {e}")
 
-    # Save JSON
-    with open(TRACKER_FILE, 'w') as f:
-        json.dump(tracker_data, f, indent=2)
+        out.write("\n}" if count else "}")
+
+    os.replace(tmp_file, TRACKER_FILE)
 
     logger.info(f"✅ Successfully imported {count} recipes to {TRACKER_FILE}")
 
@@ -37,6 +37,26 @@ TERMS_TO_REMOVE = [
     "Président"
 ]
 
+def _compile_brand_pattern(brand: str) -> re.Pattern:
+    """Builds a flexible regex for a brand term."""
+    brand_pattern = re.escape(brand)
+    # Handle different apostrophe types
+    brand_pattern = brand_pattern.replace(r"\'", r"['\u2019\u0027]")
+    brand_pattern = brand_pattern.replace(r"'", r"['\u2019\u0027]")
+    # Handle variable whitespace
+    brand_pattern = brand_pattern.replace(r'\ ', r'\s+')
+    brand_pattern = brand_pattern + r'\s*'
+    return re.compile(brand_pattern, re.IGNORECASE)
+
+# Compiled once at import (clean_ingredient runs for every scraped ingredient)
+_BRAND_PATTERNS = [_compile_brand_pattern(brand) for brand in TERMS_TO_REMOVE]
+
+# Unit alternations are ordered longest-first so overlapping prefixes
+# (kg/g, ml/l, cans/can/s) resolve on the first viable branch.
+_METRIC_UNIT_RE = re.compile(r'(\d+(?:\.\d+|¼|½|¾)?)\s+(kg|ml|g|l)\b', re.IGNORECASE)
+_SPOON_UNIT_RE = re.compile(r'(\d+(?:\.\d+|¼|½|¾)?)\s*(tbsp|tsp|pack|tub|bulb/s|clove/s|cans|can/s)\b', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
 def clean_ingredient(text: str) -> str:
     """
     Cleans an ingredient string by removing brand names and fixing formatting.
@@ -47,38 +67,20 @@ def clean_ingredient(text: str) -> str:
     ingredient = text.strip()
 
     # Remove brand terms using flexible regex matching
-    for brand in TERMS_TO_REMOVE:
-        brand_pattern = re.escape(brand)
-        # Handle different apostrophe types
-        brand_pattern = brand_pattern.replace(r"\'", r"['\u2019\u0027]")
-        brand_pattern = brand_pattern.replace(r"'", r"['\u2019\u0027]")
-        # Handle variable whitespace
-        brand_pattern = brand_pattern.replace(r'\ ', r'\s+')
-        brand_pattern = brand_pattern + r'\s*'
-        
-        ingredient = re.sub(brand_pattern, '', ingredient, flags=re.IGNORECASE)
+    for brand_re in _BRAND_PATTERNS:
+        ingredient = brand_re.sub('', ingredient)
 
     # --- UPDATED UNIT FORMATTING LOGIC ---
 
     # 1. Metric Units: Remove space (e.g., "100 g" -> "100g")
     # Matches a number followed by optional space, then specific units
-    ingredient = re.sub(
-        r'(\d+(?:\.\d+|¼|½|¾)?)\s+(kg|g|ml|l)\b', 
-        r'\1\2', 
-        ingredient,
-        flags=re.IGNORECASE
-    )
+    ingredient = _METRIC_UNIT_RE.sub(r'\1\2', ingredient)
 
     # 2. Spoons/Items: Ensure space (e.g., "1tbsp" -> "1 tbsp")
     # Matches number followed by *optional* space (or no space), then unit
-    ingredient = re.sub(
-        r'(\d+(?:\.\d+|¼|½|¾)?)\s*(tbsp|tsp|pack|tub|bulb/s|clove/s|can/s|cans)\b', 
-        r'\1 \2', 
-        ingredient,
-        flags=re.IGNORECASE
-    )
+    ingredient = _SPOON_UNIT_RE.sub(r'\1 \2', ingredient)
 
     # Collapse multiple spaces into single space
-    ingredient = re.sub(r'\s+', ' ', ingredient)
+    ingredient = _WHITESPACE_RE.sub(' ', ingredient)
     
-    return ingredient.strip()
\ No newline at end of file
+    return ingredient.strip()
@@ -2,14 +2,18 @@
 Recipe specific Notion property and block mapping.
 Translates internal Recipe Schema to Notion API structure.
 """
+import functools
 import logging
+import os
 import time
-from itertools import groupby
-from datetime import datetime
+from collections import defaultdict
+from dataclasses import dataclass
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 
 # Use generic handlers
 from notion_handlers.notion_config import DATA_SOURCES
-from notion_handlers.notion_loader import create_page_in_data_source, update_page_properties, archive_page, append_block_children
+from notion_handlers.notion_loader import create_page_in_data_source, update_page_properties, archive_page, append_block_children, list_block_children
 # Import the new image uploader
 from notion_handlers.notion_image_uploader import upload_image_from_url
 # Import Sync Tracker
@@ -17,173 +21,264 @@ from .recipe_sync_tracker import add_or_update_record, remove_record
 
 logger = logging.getLogger("recipe_importer")
 
+# Resolved once at import; save_recipe_to_notion still refuses to run without it
+_RECIPE_DATA_SOURCE_ID = DATA_SOURCES.get("recipes")
+if not _RECIPE_DATA_SOURCE_ID:
+    logger.error("Notion Recipe Data Source ID not configured.")
+
+# Independent Notion calls (image uploads) overlap here
+_notion_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="notion-io")
+
+# When true, recipes with no ingredients/steps get no section at all instead of a grey placeholder
+SKIP_EMPTY_SECTIONS = os.getenv("RECIPE_SKIP_EMPTY_SECTIONS", "false").lower() == "true"
+
+# Notion rejects any children array (top-level or nested) over 100 blocks. The create call
+# carries up to the full 100 per list so most recipes still go out in one request; only the
+# overflow is appended afterwards, in smaller batches
+NOTION_MAX_CHILDREN = 100
+CHILDREN_BATCH_SIZE = 50
+
+# How many pages a bulk save/delete works on at once; the shared @rate_limit
+# token bucket still paces the requests themselves
+BATCH_CONCURRENCY = 8
+
+def _run_batch(fn, items, concurrency=BATCH_CONCURRENCY):
+    """
+    Calls fn(*item) for each item on a short-lived pool; results come back in input order.
+    Not _notion_pool: saves queue their image uploads there, so a batch of saves on it
+    could fill every worker with jobs waiting on uploads stuck behind them.
+    """
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="notion-batch") as pool:
+        return list(pool.map(lambda item: fn(*item), items))
+
+def _chunk(blocks, n=CHILDREN_BATCH_SIZE):
+    """Yields successive slices of at most n blocks."""
+    for i in range(0, len(blocks), n):
+        yield blocks[i:i + n]
+
+def _cap_nested(blocks, n=CHILDREN_BATCH_SIZE, path=()):
+    """
+    Trims every nested children list under `blocks` to its first n entries, in place.
+    A big recipe puts all its items under one heading, so the nested lists are what need batching.
+    Returns [(path, overflow)], path being the child-index chain from `blocks` to the trimmed block;
+    outer blocks come first so their overflow is sent before anything deeper.
+    """
+    deferred = []
+    for i, block in enumerate(blocks):
+        kids = block.get(block["type"], {}).get("children")
+        if not kids:
+            continue
+        if len(kids) > n:
+            block[block["type"]]["children"] = kids[:n]
+            deferred.append((path + (i,), kids[n:]))
+        deferred.extend(_cap_nested(block[block["type"]]["children"], n, path + (i,)))
+    return deferred
+
+def _block_id_at(parent_id, path, known_ids):
+    """Resolves a child-index path under parent_id to a block id, listing each level once."""
+    block_id = parent_id
+    for depth in range(len(path)):
+        if path[:depth + 1] not in known_ids:
+            for j, child in enumerate(list_block_children(block_id)):
+                known_ids[path[:depth] + (j,)] = child["id"]
+        block_id = known_ids[path[:depth + 1]]
+    return block_id
+
+def _send_deferred(parent_id, deferred, known_ids):
+    """Appends each trimmed overflow under the block it was cut from."""
+    for path, overflow in deferred:
+        _append_children(_block_id_at(parent_id, path, known_ids), overflow)
+
+def _append_children(block_id, blocks, n=CHILDREN_BATCH_SIZE):
+    """Appends blocks under block_id in batches of n, splitting oversized nested lists the same way."""
+    for batch in _chunk(blocks, n):
+        deferred = _cap_nested(batch, n)
+        response = append_block_children(block_id, batch)
+        if deferred:
+            # The append response lists the new first-level blocks, so their ids need no lookup
+            known_ids = {(j,): child["id"] for j, child in enumerate(response.get("results", []))}
+            _send_deferred(block_id, deferred, known_ids)
+
+# Shared by reference; the Notion client only reads it when serialising
+_ANNOTATIONS_TOGGLE = {"color": "blue", "underline": True, "code": True}
+
+def _rt(content, annotations=None):
+    """Single-span rich_text array."""
+    span = {"type": "text", "text": {"content": content}}
+    if annotations:
+        span["annotations"] = annotations
+    return [span]
+
+def _toggle_heading(title, children):
+    """Collapsible heading_2 section wrapping `children`."""
+    return {
+        "object": "block",
+        "type": "heading_2",
+        "heading_2": {
+            "is_toggleable": True,
+            "rich_text": _rt(title),
+            "children": children
+        }
+    }
+
+def _video_section(video_url):
+    """'Video' toggle heading embedding an external video."""
+    return _toggle_heading("Video", [
+        {"object": "block", "type": "video", "video": {"type": "external", "external": {"url": video_url}}}
+    ])
+
+def _empty_placeholder(message):
+    return [{
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": _rt(message, {"color": "gray", "italic": True})
+        }
+    }]
+
+# Placeholders for empty sections, built once at import
+_EMPTY_BLOCKS = {
+    msg: _empty_placeholder(msg)
+    for msg in ("There are no ingredients for this recipe", "There are no steps for this recipe")
+}
+
+@dataclass(slots=True, frozen=True)
+class _ListEntry:
+    """Grouped ingredient/step entry, normalised from either a dict or a RecipeItem."""
+    text: str
+    image_url: str | None = None
+
+_ITEM_FIELDS = attrgetter("text", "group", "image_url")
+
+def _list_block(list_type, text):
+    return {"object": "block", "type": list_type, list_type: {"rich_text": _rt(text)}}
+
+def _build_block_list(group_items, list_type, recipe_title):
+    """
+    List item blocks for one group; steps with an image get a toggle + image as children.
+    """
+    # Start every step image upload up front; blocks are still assembled in order below
+    uploads = {}
+    for idx, item in enumerate(group_items):
+        if item.image_url:
+            logger.info(f"    -> Found inline image for step {idx+1}. Uploading...")
+            file_name = f"{recipe_title} - Step {idx+1}"
+            uploads[idx] = _notion_pool.submit(upload_image_from_url, item.image_url, title=file_name)
+
+    blocks = []
+    for idx, item in enumerate(group_items):
+        block = _list_block(list_type, item.text)
+
+        # Handle Inline Image (Sibling Strategy)
+        if idx in uploads:
+            file_id = uploads[idx].result()
+
+            if file_id:
+                # 1. The Toggle Block
+                toggle_block = {
+                    "object": "block",
+                    "type": "toggle",
+                    "toggle": {"rich_text": _rt(f"Step {idx+1} image", _ANNOTATIONS_TOGGLE)}
+                }
+
+                # 2. The Image Block
+                image_block = {
+                    "object": "block",
+                    "type": "image",
+                    "image": {
+                        "type": "file_upload",
+                        "file_upload": {"id": file_id}
+                    }
+                }
+
+                block[list_type]["children"] = [toggle_block, image_block]
+
+        blocks.append(block)
+    return blocks
+
 def build_notion_blocks(recipe_data, recipe_title="Untitled"):
     """
     Constructs the page content (children blocks).
+    Returns (children, has_instruction_photos).
     """
     children = []
+    has_instruction_photos = False
 
     # --- 1. DESCRIPTION ---
     if recipe_data.get('description'):
-        children.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "is_toggleable": True,
-                "rich_text": [{"type": "text", "text": {"content": "Description"}}],
-                "children": [
-                    {
-                        "object": "block",
-                        "type": "paragraph",
-                        "paragraph": {
-                            "rich_text": [{"type": "text", "text": {"content": recipe_data['description']}}]
-                        }
-                    }
-                ]
-            }
-        })
+        children.append(_toggle_heading("Description", [
+            {"object": "block", "type": "paragraph", "paragraph": {"rich_text": _rt(recipe_data['description'])}}
+        ]))
 
     # --- 2. INGREDIENTS ---
-    ingredient_blocks = _build_grouped_list(
-        items=recipe_data.get('ingredients', []),
-        list_type="bulleted_list_item",
-        default_group_title="For the main recipe",
-        empty_message="There are no ingredients for this recipe",
-        recipe_title=recipe_title
-    )
+    ingredients = recipe_data.get('ingredients', [])
+    if ingredients or not SKIP_EMPTY_SECTIONS:
+        ingredient_blocks, _ = _build_grouped_list(
+            items=ingredients,
+            list_type="bulleted_list_item",
+            default_group_title="For the main recipe",
+            empty_message="There are no ingredients for this recipe",
+            recipe_title=recipe_title
+        )
 
-    children.append({
-        "object": "block",
-        "type": "heading_2",
-        "heading_2": {
-            "is_toggleable": True,
-            "rich_text": [{"type": "text", "text": {"content": "Ingredients"}}],
-            "children": ingredient_blocks
-        }
-    })
+        children.append(_toggle_heading("Ingredients", ingredient_blocks))
 
     # --- 3. STEPS (INSTRUCTIONS) ---
-    instruction_blocks = _build_grouped_list(
-        items=recipe_data.get('instructions', []),
-        list_type="numbered_list_item",
-        default_group_title="Main Recipe",
-        empty_message="There are no steps for this recipe",
-        recipe_title=recipe_title,
-        is_instruction=True
-    )
+    instructions = recipe_data.get('instructions', [])
+    if instructions or not SKIP_EMPTY_SECTIONS:
+        instruction_blocks, has_instruction_photos = _build_grouped_list(
+            items=instructions,
+            list_type="numbered_list_item",
+            default_group_title="Main Recipe",
+            empty_message="There are no steps for this recipe",
+            recipe_title=recipe_title,
+            is_instruction=True
+        )
 
-    children.append({
-        "object": "block",
-        "type": "heading_2",
-        "heading_2": {
-            "is_toggleable": True,
-            "rich_text": [{"type": "text", "text": {"content": "Steps"}}],
-            "children": instruction_blocks
-        }
-    })
+        children.append(_toggle_heading("Steps", instruction_blocks))
 
-    return children
+    return children, has_instruction_photos
 
 
 def _build_grouped_list(items, list_type, default_group_title, empty_message, recipe_title="Recipe", is_instruction=False):
     """
     Helper to build grouped lists (Ingredients or Instructions).
     Handles inline images for instructions by placing them as siblings to a toggle.
+    Returns (blocks, has_images).
     """
     if not items:
-        return [{
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{"type": "text",
-                    "text": {"content": empty_message},
-                    "annotations": {"color": "gray", "italic": True}
-                }]
-            }
-        }]
-
-    sorted_items = sorted(items, key=lambda x: (x.get('group') if isinstance(x, dict) else x.group) or "")
-    
-    grouped_data = {}
-    for item in sorted_items:
-        if isinstance(item, dict):
-            text = item.get('text')
-            group = item.get('group')
+        # Shallow copy so callers can't grow the shared list
+        return list(_EMPTY_BLOCKS.get(empty_message) or _empty_placeholder(empty_message)), False
+
+    # Single pass; groups keep the order they first appear in the source recipe.
+    # Items are all dicts (Whisk sync) or all RecipeItems (upload endpoint), so the
+    # type is checked once and each case gets its own loop.
+    grouped_data = defaultdict(list)
+    has_images = False
+    if isinstance(items[0], dict):
+        for item in items:
             image_url = item.get('image_url')
-        else:
-            text = item.text
-            group = item.group
-            image_url = getattr(item, 'image_url', None)
-            
-        group_key = group if group else "no_group"
-        if group_key not in grouped_data:
-            grouped_data[group_key] = []
-            
-        grouped_data[group_key].append({
-            "text": text,
-            "image_url": image_url
-        })
-
-    def build_block_list(group_items):
-        blocks = []
-        for idx, item in enumerate(group_items):
-            block = {
-                "object": "block",
-                "type": list_type,
-                list_type: {
-                    "rich_text": [{"type": "text", "text": {"content": item['text']}}]
-                }
-            }
-            
-            # Handle Inline Image (Sibling Strategy)
-            if item['image_url']:
-                logger.info(f"    -> Found inline image for step {idx+1}. Uploading...")
-                file_name = f"{recipe_title} - Step {idx+1}"
-                file_id = upload_image_from_url(item['image_url'], title=file_name)
-                
-                if file_id:
-                    # 1. The Toggle Block
-                    toggle_block = {
-                        "object": "block",
-                        "type": "toggle",
-                        "toggle": {
-                            "rich_text": [{
-                                "type": "text", 
-                                "text": {"content": f"Step {idx+1} image"},
-                                "annotations": {
-                                    "color": "blue",
-                                    "underline": True,
-                                    "code": True 
-                                }
-                            }]
-                        }
-                    }
-                    
-                    # 2. The Image Block
-                    image_block = {
-                        "object": "block",
-                        "type": "image",
-                        "image": {
-                            "type": "file_upload",
-                            "file_upload": {"id": file_id}
-                        }
-                    }
-                    
-                    block[list_type]["children"] = [toggle_block, image_block]
-            
-            blocks.append(block)
-        return blocks
+            grouped_data[item.get('group') or "no_group"].append(_ListEntry(item.get('text'), image_url))
+            if image_url:
+                has_images = True
+    else:
+        for text, group, image_url in map(_ITEM_FIELDS, items):
+            grouped_data[group or "no_group"].append(_ListEntry(text, image_url))
+            if image_url:
+                has_images = True
 
     if len(grouped_data) == 1:
-        only_group_items = list(grouped_data.values())[0]
-        return build_block_list(only_group_items)
+        only_group_items = next(iter(grouped_data.values()))
+        return _build_block_list(only_group_items, list_type, recipe_title), has_images
 
     nested_blocks = []
     
     if "no_group" in grouped_data:
         nested_blocks.append(_create_toggle_block(
             title=default_group_title,
-            children=build_block_list(grouped_data["no_group"]),
+            children=_build_block_list(grouped_data["no_group"], list_type, recipe_title),
             list_type=list_type
         ))
         del grouped_data["no_group"]
@@ -191,11 +286,27 @@ def _build_grouped_list(items, list_type, default_group_title, empty_message, re
     for group_title, group_items in grouped_data.items():
         nested_blocks.append(_create_toggle_block(
             title=group_title,
-            children=build_block_list(group_items),
+            children=_build_block_list(group_items, list_type, recipe_title),
             list_type=list_type
         ))
         
-    return nested_blocks
+    return nested_blocks, has_images
+
+
+def ms_to_local_iso(ms):
+    """
+    Unix milliseconds -> naive local ISO string, matching datetime.fromtimestamp(...).isoformat()
+    (microseconds only when non-zero) without building a datetime per call.
+    """
+    secs, rem_ms = divmod(int(ms), 1000)
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(secs))
+    return f"{stamp}.{rem_ms * 1000:06d}" if rem_ms else stamp
+
+
+@functools.lru_cache(maxsize=1)
+def _batch_iso(batch_ts):
+    """Local ISO timestamp for a batch stamp; formatted once per batch."""
+    return ms_to_local_iso(batch_ts)
 
 
 def _create_toggle_block(title, children, list_type):
@@ -203,97 +314,94 @@ def _create_toggle_block(title, children, list_type):
         "object": "block",
         "type": "toggle",
         "toggle": {
-            "rich_text": [{
-                "type": "text",
-                "text": {"content": title},
-                "annotations": {
-                    "color": "blue",
-                    "underline": True,
-                    "code": True 
-                }
-            }],
+            "rich_text": _rt(title, _ANNOTATIONS_TOGGLE),
             "children": children
         }
     }
 
 
-def save_recipe_to_notion(recipe_data, whisk_id, was_made=False):
+def _coerce_int(data, key):
+    """Single .get per field; missing/empty values become 0."""
+    value = data.get(key)
+    return int(value) if value else 0
+
+
+# Recipe field -> Notion property table used by save_recipe_to_notion
+
+def _collection_prop(cats):
+    if isinstance(cats, str):
+        cats = [cats]
+    return {"multi_select": [{"name": c} for c in cats if c]}
+
+_OPTIONAL_PROPS = (
+    ("category", "Collection", _collection_prop),
+    ("source", "Source Title", lambda v: {"rich_text": [{"text": {"content": v}}]}),
+    ("url", "Source Link", lambda v: {"url": v}),
+    ("video_url", "Video Link", lambda v: {"url": v}),
+)
+
+
+def save_recipe_to_notion(recipe_data, whisk_id, was_made=False, batch_ts=None):
     """
     Main entry point to save a recipe to Notion using Data Source ID.
+    batch_ts (unix ms) lets a sync run stamp every page with the same 'Date Added (Unix)',
+    and is also the 'Date Added' fallback when the recipe has no date of its own.
     """
-    data_source_id = DATA_SOURCES.get("recipes")
+    data_source_id = _RECIPE_DATA_SOURCE_ID
     if not data_source_id:
         logger.error("Notion Recipe Data Source ID not configured.")
         return False
 
+    if batch_ts is None:
+        batch_ts = int(time.time() * 1000)
+
     recipe_title = recipe_data.get('title', 'Untitled')
     logger.info(f"  -> Preparing Notion payload for: '{recipe_title}'")
     
-    date_added_iso = recipe_data.get('date_added_iso')
-    if not date_added_iso:
-        date_added_iso = datetime.now().isoformat()
+    # Kick off the main image upload first; it is joined just before the page is created
+    img_url = recipe_data.get('imageUrl')
+    upload_future = None
+    if img_url:
+        logger.info("  -> Uploading Main Recipe Image...")
+        upload_future = _notion_pool.submit(upload_image_from_url, img_url, title=recipe_title)
+
+    date_added_iso = recipe_data.get('date_added_iso') or _batch_iso(batch_ts)
 
     properties = {
         "Recipe Id": {"rich_text": [{"text": {"content": str(whisk_id)}}]},
         "Name": {"title": [{"text": {"content": recipe_title}}]},
-        "Date Added (Unix)": {"rich_text": [{"text": {"content": str(int(time.time() * 1000))}}]},
+        "Date Added (Unix)": {"rich_text": [{"text": {"content": str(batch_ts)}}]},
         "Date Added": {"date": {"start": date_added_iso}},
-        "Servings": {"number": int(recipe_data.get('servings') or 0)},
-        "Total Time": {"number": _calculate_total_time(recipe_data)},
-        "Prep Time": {"number": int(recipe_data.get('prep_time') or 0)},
-        "Cook Time": {"number": int(recipe_data.get('cook_time') or 0)},
         "Made?": {"checkbox": was_made}, 
     }
 
-    if recipe_data.get('category'):
-        cats = recipe_data['category']
-        if isinstance(cats, str):
-            cats = [cats]
-        properties["Collection"] = {
-            "multi_select": [{"name": c} for c in cats if c]
-        }
-    
-    if recipe_data.get('source'):
-        properties["Source Title"] = {"rich_text": [{"text": {"content": recipe_data['source']}}]}
-        
-    if recipe_data.get('url'):
-        properties["Source Link"] = {"url": recipe_data['url']}
+    # Numeric fields are always written (0 when missing); the rest only when present
+    prep = _coerce_int(recipe_data, 'prep_time')
+    cook = _coerce_int(recipe_data, 'cook_time')
+    properties["Servings"] = {"number": _coerce_int(recipe_data, 'servings')}
+    properties["Prep Time"] = {"number": prep}
+    properties["Cook Time"] = {"number": cook}
+    properties["Total Time"] = {"number": prep + cook}
+
+    for src, dst, to_prop in _OPTIONAL_PROPS:
+        value = recipe_data.get(src)
+        if value:
+            properties[dst] = to_prop(value)
 
     video_url = recipe_data.get('video_url')
-    if video_url:
-        properties["Video Link"] = {"url": video_url}
 
     # --- 2. Build Content Blocks ---
-    children = build_notion_blocks(recipe_data, recipe_title)
+    children, has_instruction_photos = build_notion_blocks(recipe_data, recipe_title)
     
     if video_url:
-        children.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "Video"}}],
-                "is_toggleable": True,
-                "children": [
-                    {
-                        "object": "block",
-                        "type": "video",
-                        "video": {
-                            "type": "external",
-                            "external": {"url": video_url}
-                        }
-                    }
-                ]
-            }
-        })
+        children.append(_video_section(video_url))
 
     # --- 3. Handle Main Image ---
-    img_url = recipe_data.get('imageUrl')
     cover_payload = None
     image_type_record = "none"
     
-    if img_url:
-        logger.info("  -> Uploading Main Recipe Image...")
-        file_id = upload_image_from_url(img_url, title=recipe_title)
+    if upload_future:
+        file_id = upload_future.result()
         
         if file_id:
             notion_file_obj = {
@@ -313,10 +421,14 @@ def save_recipe_to_notion(recipe_data, whisk_id, was_made=False):
             logger.warning("  -> Main image upload failed.")
 
     # --- 4. Create Page ---
+    # Create with up to 100 blocks per list, each nested list cut to the limit;
+    # the rest is appended in order afterwards under the block it belongs to
+    head, tail = children[:NOTION_MAX_CHILDREN], children[NOTION_MAX_CHILDREN:]
+    deferred = _cap_nested(head, NOTION_MAX_CHILDREN)
     response = create_page_in_data_source(
         data_source_id=data_source_id,
         properties=properties,
-        children=children,
+        children=head,
         cover=cover_payload
     )
     
@@ -324,13 +436,8 @@ def save_recipe_to_notion(recipe_data, whisk_id, was_made=False):
     if page_id != 'unknown':
         logger.info(f"  -> Notion page created (ID: {page_id})")
         
-        has_instruction_photos = False
-        for inst in recipe_data.get('instructions', []):
-             if getattr(inst, 'image_url', None) or (isinstance(inst, dict) and inst.get('image_url')):
-                 has_instruction_photos = True
-                 break
-
         # --- 5. Update Tracker ---
+        # Recorded before the follow-up appends so a live page is never left untracked
         add_or_update_record(
             whisk_recipe_id=whisk_id,
             notion_page_id=page_id,
@@ -341,10 +448,46 @@ def save_recipe_to_notion(recipe_data, whisk_id, was_made=False):
             was_made=was_made,
             recipe_title=recipe_title
         )
+
+        # --- 6. Append Remaining Content ---
+        # Appends aren't retried on 5xx/timeouts, so on failure the half-built page is
+        # archived (and its record dropped) and the next sync creates it again from scratch
+        try:
+            _send_deferred(page_id, deferred, {})
+            if tail:
+                _append_children(page_id, tail)
+        except Exception as e:
+            logger.error(f"  -> Failed to append content to {page_id}: {e}. Rolling back page...")
+            try:
+                delete_recipe_from_notion(page_id, whisk_id)
+            except Exception as rollback_error:
+                # The record stays, so the next sync updates this page rather than duplicating it
+                logger.error(f"  -> Rollback of {page_id} failed, keeping its tracker record: {rollback_error}")
+            raise
         return True
     
     return False
 
+def _save_recipe_safe(recipe_data, whisk_id, was_made, batch_ts):
+    """save_recipe_to_notion for batch use: logs a failure and returns False instead of raising."""
+    try:
+        return save_recipe_to_notion(recipe_data, whisk_id, was_made, batch_ts)
+    except Exception as e:
+        logger.error(f"  -> Failed to save '{recipe_data.get('title', 'Untitled')}' to Notion: {e}")
+        return False
+
+def save_recipes_to_notion(recipes, concurrency=BATCH_CONCURRENCY, batch_ts=None):
+    """
+    Saves many recipes to Notion concurrently (bulk imports).
+    Accepts (recipe_data, whisk_id) or (recipe_data, whisk_id, was_made) tuples.
+    Returns a list of success flags in the same order as the input.
+    Notion's 3 rps limit is still enforced by the shared @rate_limit token bucket in notion_loader.
+    """
+    if batch_ts is None:
+        batch_ts = int(time.time() * 1000)
+    jobs = [(recipe_data, whisk_id, rest[0] if rest else False, batch_ts) for recipe_data, whisk_id, *rest in recipes]
+    return _run_batch(_save_recipe_safe, jobs, concurrency)
+
 def update_recipe_image_in_notion(page_id, whisk_id, image_url, title=None):
     """
     Scenario B: Updates an existing recipe to use 'file_upload' image.
@@ -389,30 +532,12 @@ def update_recipe_video_in_notion(page_id, whisk_id, video_url, title=None):
     properties = {
         "Video Link": {"url": video_url}
     }
-    update_page_properties(page_id=page_id, properties=properties)
     
-    video_block = [
-        {
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "Video"}}],
-                "is_toggleable": True,
-                "children": [
-                    {
-                        "object": "block",
-                        "type": "video",
-                        "video": {
-                            "type": "external",
-                            "external": {"url": video_url}
-                        }
-                    }
-                ]
-            }
-        }
-    ]
+    update_page_properties(page_id=page_id, properties=properties)
     
-    append_block_children(page_id, video_block)
+    # Kept in order (property, block, tracker): if the property update fails, the block
+    # must not be appended either, or the next sync would add a second Video section
+    append_block_children(page_id, [_video_section(video_url)])
     
     add_or_update_record(
         whisk_recipe_id=whisk_id,
@@ -451,7 +576,19 @@ def delete_recipe_from_notion(page_id, whisk_id):
     remove_record(whisk_id)
     logger.info("  -> ✅ Recipe deleted from Notion.")
 
-def _calculate_total_time(data):
-    p = data.get('prep_time') or 0
-    c = data.get('cook_time') or 0
-    return int(p) + int(c)
\ No newline at end of file
+def _delete_recipe_safe(page_id, whisk_id):
+    """delete_recipe_from_notion for batch use: logs a failure and returns False instead of raising."""
+    try:
+        delete_recipe_from_notion(page_id, whisk_id)
+        return True
+    except Exception as e:
+        logger.error(f"Error deleting {whisk_id}: {e}")
+        return False
+
+def delete_recipes_from_notion(deletions, concurrency=BATCH_CONCURRENCY):
+    """
+    Archives many recipe pages concurrently (full sync clean-up).
+    Accepts (page_id, whisk_id) tuples; returns success flags in input order.
+    The shared @rate_limit token bucket keeps the archive calls within Notion's rate limit.
+    """
+    return _run_batch(_delete_recipe_safe, deletions, concurrency)
@@ -2,19 +2,26 @@
 Recipe Synchronization Logic
 Handles comparing Whisk data vs Local Tracker and executing A/B/C logic.
 """
+import hashlib
+import json
 import logging
 import os
+import queue
 import time
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .whisk_auth import get_access_token
 from .whisk_fetch import fetch_whisk_list, fetch_recipe_details, fetch_recipe_review_status
-from .recipe_sync_tracker import load_tracker, add_or_update_record
+from .recipe_sync_tracker import load_tracker, add_or_update_record, flush_tracker, get_ids_by_status, TrackerCorruptError
 from .recipe_notion_adapter import (
     save_recipe_to_notion, 
+    save_recipes_to_notion,
     update_recipe_image_in_notion, 
     update_recipe_video_in_notion,
     update_recipe_made_status_in_notion,
-    delete_recipe_from_notion
+    delete_recipe_from_notion,
+    delete_recipes_from_notion,
+    ms_to_local_iso
 )
 from .whisk_collections import get_collection_name_by_id
 from .email_notifier import send_sync_report # [NEW] Import email notifier
@@ -28,16 +35,36 @@ if not logger.handlers:
 logger.setLevel(logging.INFO)
 logger.propagate = False
 
+def _ms_to_iso(ms):
+    """
+    Whisk 'added_at' (unix ms, int or str) -> local ISO string for 'Date Added'.
+    Returns None when missing or unparseable, so the adapter falls back to the batch date.
+    """
+    if isinstance(ms, str) and ms.isdigit():
+        ms = int(ms)
+    if isinstance(ms, bool) or not isinstance(ms, (int, float)) or ms <= 0:
+        if ms:
+            logger.warning(f"Failed to parse added_at date: {ms!r}")
+        return None
+    try:
+        return ms_to_local_iso(ms)
+    except (ValueError, OverflowError, OSError) as e:
+        # Numeric but outside what the platform's localtime() accepts
+        logger.warning(f"Failed to parse added_at date: {e}")
+        return None
+
 def validate_list_requirements(content, collections):
     """
     Validates fields present in the List View (Phase 1).
     Returns (is_valid: bool, failure_reason: str).
+    Checks run in a fixed order so the reported reason is stable; missing keys
+    are read as None rather than allocating empty defaults on every call.
     """
-    source_name = content.get('source', {}).get('display_name')
-    if not source_name:
+    source = content.get('source')
+    if not source or not source.get('display_name'):
         return False, "Missing Source Name"
 
-    images = content.get('images', [])
+    images = content.get('images')
     if not images or not images[0].get('url'):
         return False, "Missing Image"
 
@@ -47,8 +74,7 @@ def validate_list_requirements(content, collections):
     elif not collections:
         return False, "Missing Category"
 
-    ingredients = content.get('ingredients', [])
-    if not ingredients:
+    if not content.get('ingredients'):
         return False, "Missing Ingredients"
 
     return True, None
@@ -66,46 +92,44 @@ def validate_instructions(details):
         
     return True, None
 
+# Whisk recipe_videos entry keys we can embed; add a platform here to support it
+_VIDEO_KEYS = ('youtube_video', 'tiktok_video')
+
+def _extract_video_url(recipe_videos):
+    """
+    Link of the first supported entry in Whisk's recipe_videos (list order), or None.
+    """
+    for vid in recipe_videos or ():
+        for key in _VIDEO_KEYS:
+            if key in vid:
+                return vid[key].get('original_link')
+    return None
+
+# Internal RecipeSchema field -> how to read it from Whisk list/detail content
+_EXTRACTORS = {
+    "title": lambda c: c.get('name'),
+    "description": lambda c: c.get('description'),
+    "url": lambda c: c.get('source', {}).get('source_recipe_url'),
+    "source": lambda c: c.get('source', {}).get('display_name'),
+    "servings": lambda c: c.get('servings'),
+    "prep_time": lambda c: c.get('durations', {}).get('prep_time'),
+    "cook_time": lambda c: c.get('durations', {}).get('cook_time'),
+    "imageUrl": lambda c: (c.get('images') or [{}])[0].get('url'),
+    "video_url": lambda c: _extract_video_url(c.get('recipe_videos')),
+}
+
 def transform_whisk_to_internal(content, collections=None, details=None):
     """
     Maps Whisk content to internal RecipeSchema.
     """
-    internal_data = {
-        "title": content.get('name'),
-        "description": content.get('description'),
-        "url": content.get('source', {}).get('source_recipe_url'),
-        "source": content.get('source', {}).get('display_name'),
-        "servings": content.get('servings'),
-        "prep_time": content.get('durations', {}).get('prep_time'),
-        "cook_time": content.get('durations', {}).get('cook_time'),
-        "category": [], 
-        "ingredients": [],
-        "instructions": [],
-        "instruction_images": [], 
-        "imageUrl": None,
-        "video_url": None
-    }
-
-    # Images
-    images = content.get('images', [])
-    if images:
-        internal_data['imageUrl'] = images[0].get('url')
-
-    # Video Extraction
-    recipe_videos = content.get('recipe_videos', [])
-    if recipe_videos:
-        for vid in recipe_videos:
-            if 'youtube_video' in vid:
-                internal_data['video_url'] = vid['youtube_video'].get('original_link')
-                break
-            elif 'tiktok_video' in vid:
-                internal_data['video_url'] = vid['tiktok_video'].get('original_link')
-                break
+    # Scalar fields come straight from the extractor table; lists are filled below
+    internal_data = {key: extract(content) for key, extract in _EXTRACTORS.items()}
+    internal_data["category"] = []
+    internal_data["instructions"] = []
+    internal_data["instruction_images"] = []
 
     # Ingredients
-    raw_ingredients = content.get('ingredients', [])
-    for ing in raw_ingredients:
-        internal_data['ingredients'].append({"text": ing.get('text')})
+    internal_data["ingredients"] = [{"text": ing.get('text')} for ing in content.get('ingredients', [])]
 
     # Instructions
     if details and 'recipe' in details and 'instructions' in details['recipe']:
@@ -141,10 +165,392 @@ def transform_whisk_to_internal(content, collections=None, details=None):
 
     return internal_data
 
+_PAGES_DONE = object()  # End-of-pages marker for the Whisk page queue
+
+def _fetch_pages(pages, limit, full_sync, access_token):
+    """
+    Producer thread for run_sync: pushes each Whisk list page onto `pages`,
+    then _PAGES_DONE. A fetch error is pushed too so the consumer can re-raise it.
+    """
+    next_cursor = None
+    fetched = 0
+    try:
+        while True:
+            logger.info(f"🔎 Fetching Whisk recipes (Limit: {limit})...")
+            data = fetch_whisk_list(limit=limit, after_cursor=next_cursor, access_token=access_token)
+            
+            recipes_list = data.get('recipes', [])
+            fetched += len(recipes_list)
+            pages.put(recipes_list)
+            
+            paging = data.get('paging', {})
+            cursors = paging.get('cursors', {})
+            next_cursor = cursors.get('after')
+            
+            if not next_cursor:
+                break 
+                
+            if not full_sync:
+                if fetched >= limit:
+                    break
+    except Exception as e:
+        pages.put(e)
+    finally:
+        pages.put(_PAGES_DONE)
+
+# Recipes already checked for step photos (and found none) are re-checked at most this often
+PHOTO_RECHECK_SECONDS = 7 * 24 * 60 * 60
+
+def _should_recheck_photos(record):
+    checked_at = record.get('photos_checked_at')
+    return not checked_at or time.time() - checked_at >= PHOTO_RECHECK_SECONDS
+
+def _content_hash(content):
+    """Stable digest of a Whisk list item's content."""
+    return hashlib.blake2b(json.dumps(content, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+def _is_settled(record):
+    """
+    True when nothing outside the list content can still change the page:
+    already made, instruction photos present and the image uploaded.
+    Only settled records may be skipped on an unchanged content hash.
+    """
+    return bool(
+        record.get('status') != 'rejected'
+        and record.get('was_made')
+        and record.get('instruction_photos')
+        and record.get('image_type') != 'external'
+    )
+
+# Per-item stat deltas returned by _process_item; "processed" marks ids kept on a full sync
+# and "create" carries a new recipe's save arguments, flushed in one batch after the scan
+_OUTCOME_COUNTS = ("matched", "updated", "created", "errors", "rejected")
+
+def _new_outcome():
+    outcome = dict.fromkeys(_OUTCOME_COUNTS, 0)
+    outcome.update(processed=False, create=None, rejection_details=[], error_details=[])
+    return outcome
+
+def _prefetch_whisk(item, tracker, pool, access_token):
+    """
+    Submits the Whisk lookups an item's worker will need to `pool` ahead of time:
+    review status unless already made, and details for recipes headed for creation
+    (untracked or previously rejected). Items failing Phase 1 validation get neither.
+    Returns (details_future, made_future); either may be None.
+    """
+    content = item.get('content', {})
+    whisk_id = content.get('id')
+    if not whisk_id:
+        return None, None
+    is_valid, _ = validate_list_requirements(content, item.get('collections', []))
+    if not is_valid:
+        return None, None
+
+    record = tracker.get(whisk_id)
+    made_future = None
+    if not (record and record.get('was_made')):
+        made_future = pool.submit(fetch_recipe_review_status, whisk_id, access_token=access_token)
+    details_future = None
+    if not record or record.get('status') == 'rejected':
+        details_future = pool.submit(fetch_recipe_details, whisk_id, access_token=access_token)
+    return details_future, made_future
+
+def _reject(outcome, whisk_id, title, reason):
+    """Counts a rejection for the sync report and marks it in the (in-memory) tracker."""
+    outcome["rejected"] += 1
+    outcome["rejection_details"].append({
+        "id": whisk_id,
+        "name": title or 'Unknown',
+        "reason": reason
+    })
+    add_or_update_record(
+        whisk_recipe_id=whisk_id,
+        notion_page_id=None,
+        status="rejected",
+        recipe_video=False,
+        instruction_photos=False,
+        was_made=False,
+        recipe_title=title
+    )
+
+def _process_item(item, tracker, access_token, batch_ts, details_future=None, made_future=None):
+    """
+    Runs the validate / A-B-C-D / create flow for one Whisk list item.
+    Runs on a worker thread. Only the run stats are kept local: returns (whisk_id, outcome),
+    which run_sync merges into its stats. Tracker writes (rejections, content_hash /
+    photos_checked_at, Notion updates and re-creates) go to the shared tracker under its lock.
+    details_future / made_future, when given, are prefetched fetch_recipe_details and
+    fetch_recipe_review_status calls (see _prefetch_whisk).
+    """
+    outcome = _new_outcome()
+    whisk_id = None
+    try:
+        content = item.get('content', {})
+        collections = item.get('collections', []) # Valid for List View
+        whisk_id = content.get('id')
+        title = content.get('name') 
+        
+        if not whisk_id:
+            return whisk_id, outcome
+        
+        # --- VALIDATION PHASE 1 (List View) ---
+        is_valid, reason = validate_list_requirements(content, collections)
+        if not is_valid:
+            # Log rejection details
+            logger.warning(f"Rejecting recipe (Whisk ID: {whisk_id})")
+            logger.warning(f"  -> {reason} ('{title}')")
+            _reject(outcome, whisk_id, title, reason)
+            return whisk_id, outcome
+
+        outcome["processed"] = True
+        local_record = tracker.get(whisk_id)
+        
+        # Tracker flags are read once here; the branches below use these locals
+        notion_page_id = content_hash = lr_status = lr_image_type = None
+        lr_made = lr_photos = lr_video = False
+        if local_record:
+            notion_page_id = local_record.get('notion_page_id') or local_record.get('notion_id')
+            lr_status = local_record.get('status', 'new')
+            lr_image_type = local_record.get('image_type')
+            lr_made = local_record.get('was_made', False)
+            lr_photos = local_record.get('instruction_photos')
+            lr_video = local_record.get('recipe_video')
+            content_hash = _content_hash(content)
+            # Same content as last time on a settled record: nothing to check, no HTTP at all
+            if local_record.get('content_hash') == content_hash and _is_settled(local_record):
+                outcome["matched"] += 1
+                return whisk_id, outcome
+
+        # --- CHECK IF MADE? ---
+        was_made = False
+        should_check_made = True
+        if lr_made:
+            was_made = True
+            should_check_made = False
+
+        if should_check_made:
+            if made_future is not None:
+                was_made = made_future.result()
+            else:
+                was_made = fetch_recipe_review_status(whisk_id, access_token=access_token)
+
+        # --- EXISTING RECIPE CHECK (Updates) ---
+        if local_record:
+            # If previously rejected but now valid in list view, treat as New
+            if lr_status == 'rejected':
+                 local_record = None # Force fall-through to Create logic
+            else:
+                updates_performed = False
+                recreation_triggered = False # Flag to skip other updates if recreating
+                                    
+                # D: Instruction Photos Update (Check First: Re-create strategy)
+                if not lr_photos and _should_recheck_photos(local_record):
+                    details = fetch_recipe_details(whisk_id, access_token=access_token)
+                    
+                    has_step_photos = False
+                    if details and 'recipe' in details:
+                         steps = details['recipe'].get('instructions', {}).get('steps', [])
+                         for step in steps:
+                             if step.get('images'):
+                                 has_step_photos = True
+                                 break
+                    
+                    if has_step_photos:
+                        logger.info(f"Updating existing recipe (Whisk ID: {whisk_id})")
+                        logger.info(f"  -> Adding Instruction photos (by removing and re-creating page)...")
+                        
+                        delete_recipe_from_notion(notion_page_id, whisk_id)
+                        
+                        recipe_data = transform_whisk_to_internal(content, collections, details)
+                        
+                        if date_added_iso := _ms_to_iso(item.get('added_at')):
+                            recipe_data['date_added_iso'] = date_added_iso
+                        
+                        if save_recipe_to_notion(recipe_data, whisk_id, was_made=was_made, batch_ts=batch_ts):
+                             updates_performed = True
+                             recreation_triggered = True # Don't run A/B/C
+                        else:
+                             outcome["errors"] += 1
+                             # [NEW] Capture error
+                             outcome["error_details"].append({ "id": whisk_id, "name": title or 'Unknown', "error": "Failed to re-create page for photo update" })
+                    
+                    elif details and 'recipe' in details:
+                        # No photos found; don't fetch details again until the recheck window passes
+                        add_or_update_record(
+                            whisk_recipe_id=whisk_id,
+                            notion_page_id=notion_page_id,
+                            status=lr_status,
+                            photos_checked_at=int(time.time())
+                        )
+
+                # Only check A, B, C if we didn't just delete and re-create the page
+                if not recreation_triggered:
+                    
+                    # A: Image Update
+                    if lr_image_type == 'external':
+                        logger.info(f"Updating existing recipe (Whisk ID: {whisk_id})")
+                        #logger.info(f"Replacing referenced image with uploaded image")
+                        
+                        images = content.get('images', [])
+                        img_url = images[0].get('url') if images else None
+                        
+                        if img_url and notion_page_id:
+                            if update_recipe_image_in_notion(notion_page_id, whisk_id, img_url, title):
+                                updates_performed = True
+                            else:
+                                outcome["errors"] += 1
+                    
+                    # B: Video Update
+                    video_url = _extract_video_url(content.get('recipe_videos'))
+                    
+                    if video_url and not lr_video:
+                        logger.info(f"Updating existing recipe (Whisk ID: {whisk_id})")
+                        #logger.info(f"Adding YouTube linked video to recipe")
+                        
+                        if update_recipe_video_in_notion(notion_page_id, whisk_id, video_url, title):
+                            updates_performed = True
+                        else:
+                            outcome["errors"] += 1
+
+                    # C: Was Made Update
+                    if was_made and not lr_made:
+                        logger.info(f"Updating existing recipe (Whisk ID: {whisk_id})")
+                        #logger.info(f"Marking recipe as 'made'")
+                    
+                        if update_recipe_made_status_in_notion(notion_page_id, whisk_id, True, title):
+                            updates_performed = True
+                        else:
+                            outcome["errors"] += 1
+
+                if updates_performed:
+                    outcome["updated"] += 1
+                else:
+                    outcome["matched"] += 1
+                    # Remember the content so the next run can skip this record outright
+                    if not outcome["errors"] and _is_settled(local_record) and local_record.get('content_hash') != content_hash:
+                        add_or_update_record(
+                            whisk_recipe_id=whisk_id,
+                            notion_page_id=notion_page_id,
+                            status=lr_status,
+                            content_hash=content_hash
+                        )
+
+        # --- NEW RECIPE ---
+        if not local_record:
+            logger.info(f"Creating new recipe (Whisk ID: {whisk_id})")
+            
+            if details_future is not None:
+                details = details_future.result()
+            else:
+                details = fetch_recipe_details(whisk_id, access_token=access_token)
+            
+            # Phase 2 Validation (Instructions)
+            is_valid_inst, reason_inst = validate_instructions(details)
+            if not is_valid_inst:
+                logger.warning(f"  -> Skipping Creation for {whisk_id}: {reason_inst}")
+                _reject(outcome, whisk_id, title, reason_inst)
+                return whisk_id, outcome
+
+            # Transform (Scenario C)
+            recipe_data = transform_whisk_to_internal(content, collections, details)
+            
+            # Extra Safety: Check if categories were actually mapped
+            if not recipe_data['category']:
+                logger.warning(f"  -> Skipping Creation for {whisk_id}: Missing Category")
+                _reject(outcome, whisk_id, title, "Missing Category (Detail view mapping failed)")
+                return whisk_id, outcome
+
+            if date_added_iso := _ms_to_iso(item.get('added_at')):
+                recipe_data['date_added_iso'] = date_added_iso
+            
+            # Saved with the rest of this run's new recipes once the scan finishes
+            outcome["create"] = (recipe_data, whisk_id, was_made, title)
+
+    except Exception as e:
+        logger.error(f"Error processing recipe {item.get('content', {}).get('id', 'unknown')}: {e}")
+        outcome["errors"] += 1
+        # [NEW] Capture exception
+        outcome["error_details"].append({
+            "id": item.get('content', {}).get('id'),
+            "name": item.get('content', {}).get('name', 'Unknown'),
+            "error": str(e)
+        })
+
+    return whisk_id, outcome
+
+def _retry_item(whisk_id, record, access_token, batch_ts):
+    """
+    Re-validates one previously rejected recipe from its detail view and creates it if it now passes.
+    Runs on a worker thread; returns this item's stat deltas for run_sync to merge.
+    """
+    outcome = {"retried_success": 0, "errors": 0}
+
+    # Fetch title from tracker if available, or default
+    current_title = record.get('recipe_title') or 'Unknown Title'
+
+    logger.info(f"  -> Retrying {whisk_id} ('{current_title}')...")
+
+    try:
+        # Fetch full details directly
+        details = fetch_recipe_details(whisk_id, access_token=access_token)
+        if not details or 'recipe' not in details:
+            logger.warning(f"     -> Failed to fetch details for {whisk_id}. Still rejected.")
+            return outcome
+
+        content = details['recipe']
+        title = content.get('name')
+
+        # [FIX] Pass None for collections so validate_list_requirements skips category check
+        # Category will be checked later after transform
+        collections = None 
+
+        is_valid, reason = validate_list_requirements(content, collections)
+        if not is_valid:
+             logger.warning(f"     -> Still Invalid: {reason}")
+             return outcome
+
+        is_valid_inst, reason_inst = validate_instructions(details)
+        if not is_valid_inst:
+             logger.warning(f"     -> Still Invalid: {reason_inst}")
+             return outcome
+
+        recipe_data = transform_whisk_to_internal(content, None, details)
+
+        if not recipe_data['category']:
+            logger.warning(f"     -> Still Invalid: Missing Category (Mapped from IDs)")
+            return outcome
+
+        logger.info(f"     -> Validation passed! Creating Notion page...")
+
+        was_made = fetch_recipe_review_status(whisk_id, access_token=access_token)
+
+        if date_added_iso := _ms_to_iso(content.get('added_at')):
+            recipe_data['date_added_iso'] = date_added_iso
+
+        success = save_recipe_to_notion(recipe_data, whisk_id, was_made=was_made, batch_ts=batch_ts)
+        if success: 
+            outcome["retried_success"] += 1
+            logger.info(f"     -> ✅ Successfully recovered '{title}' (Whisk ID: {whisk_id})")
+        else: 
+            outcome["errors"] += 1
+
+    except Exception as e:
+        logger.error(f"     -> Error retrying {whisk_id}: {e}")
+        outcome["errors"] += 1
+
+    return outcome
+
 def run_sync(full_sync=False, retry_rejected=False, notion_event_page_id=None):
     """
     Main execution entry point.
+    Tracker changes are written once, in finally, so a crash mid-sync still keeps its progress.
     """
+    try:
+        return _run_sync(full_sync, retry_rejected, notion_event_page_id)
+    finally:
+        flush_tracker()
+
+def _run_sync(full_sync, retry_rejected, notion_event_page_id):
     logger.info(f"🚀 Starting Recipe Sync (Full Sync: {full_sync}, Retry Rejected: {retry_rejected})")
     
     # 1. Get Token ONCE at start
@@ -155,7 +561,14 @@ def run_sync(full_sync=False, retry_rejected=False, notion_event_page_id=None):
     
     access_token = token_data['access_token']
 
-    tracker = load_tracker()
+    try:
+        tracker = load_tracker()
+    except TrackerCorruptError as e:
+        logger.error(f"❌ {e}. Aborting sync.")
+        return {"errors": 1}
+
+    # Shared 'Date Added (Unix)' stamp for every page created in this run
+    batch_ts = int(time.time() * 1000)
     
     stats = {
         "matched": 0, 
@@ -172,70 +585,21 @@ def run_sync(full_sync=False, retry_rejected=False, notion_event_page_id=None):
     # --- 2. RETRY REJECTED LOGIC (EXCLUSIVE) ---
     if retry_rejected:
         logger.info("🔄 RETRY MODE: Processing previously rejected recipes...")
-        rejected_ids = [k for k, v in tracker.items() if v.get('status') == 'rejected']
+        rejected_ids = get_ids_by_status('rejected')
         
         if not rejected_ids:
             logger.info("  -> No rejected recipes found to retry.")
         
-        for whisk_id in rejected_ids:
-            # Fetch title from tracker if available, or default
-            record = tracker.get(whisk_id, {})
-            current_title = record.get('recipe_title') or 'Unknown Title'
-            
-            logger.info(f"  -> Retrying {whisk_id} ('{current_title}')...")
-            
-            try:
-                # Fetch full details directly
-                details = fetch_recipe_details(whisk_id, access_token=access_token)
-                if not details or 'recipe' not in details:
-                    logger.warning(f"     -> Failed to fetch details for {whisk_id}. Still rejected.")
-                    continue
-                
-                content = details['recipe']
-                title = content.get('name')
-                
-                # [FIX] Pass None for collections so validate_list_requirements skips category check
-                # Category will be checked later after transform
-                collections = None 
-                
-                is_valid, reason = validate_list_requirements(content, collections)
-                if not is_valid:
-                     logger.warning(f"     -> Still Invalid: {reason}")
-                     continue
-                     
-                is_valid_inst, reason_inst = validate_instructions(details)
-                if not is_valid_inst:
-                     logger.warning(f"     -> Still Invalid: {reason_inst}")
-                     continue
-
-                recipe_data = transform_whisk_to_internal(content, None, details)
-                
-                if not recipe_data['category']:
-                    logger.warning(f"     -> Still Invalid: Missing Category (Mapped from IDs)")
-                    continue
-
-                logger.info(f"     -> Validation passed! Creating Notion page...")
-                
-                time.sleep(0.5)
-                was_made = fetch_recipe_review_status(whisk_id, access_token=access_token)
-                
-                added_at_ms = content.get('added_at') 
-                if added_at_ms:
-                    try:
-                        dt = datetime.fromtimestamp(int(added_at_ms) / 1000.0)
-                        recipe_data['date_added_iso'] = dt.isoformat()
-                    except: pass
-
-                success = save_recipe_to_notion(recipe_data, whisk_id, was_made=was_made)
-                if success: 
-                    stats["retried_success"] += 1
-                    logger.info(f"     -> ✅ Successfully recovered '{title}' (Whisk ID: {whisk_id})")
-                else: 
-                    stats["errors"] += 1
-
-            except Exception as e:
-                logger.error(f"     -> Error retrying {whisk_id}: {e}")
-                stats["errors"] += 1
+        # Each retry is independent (details fetch, review status, Notion create), so they overlap
+        workers = int(os.getenv("RECIPE_SYNC_WORKERS", 5))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="recipe-retry") as pool:
+            futures = [
+                pool.submit(_retry_item, whisk_id, tracker.get(whisk_id, {}), access_token, batch_ts)
+                for whisk_id in rejected_ids
+            ]
+            for future in as_completed(futures):
+                for key, value in future.result().items():
+                    stats[key] += value
         
         # Return immediately after retry logic
         logger.info(f"🏁 Retry Job Complete. Recovered: {stats['retried_success']}")
@@ -245,287 +609,84 @@ def run_sync(full_sync=False, retry_rejected=False, notion_event_page_id=None):
     # --- 3. NORMAL SYNC LOGIC (Only runs if retry_rejected=False) ---
     
     limit = int(os.getenv("WHISK_FETCH_LIMIT", 100))
-    next_cursor = None
-    all_whisk_recipes = []
     
-    while True:
-        logger.info(f"🔎 Fetching Whisk recipes (Limit: {limit})...")
-        data = fetch_whisk_list(limit=limit, after_cursor=next_cursor, access_token=access_token)
-        
-        recipes_list = data.get('recipes', [])
-        all_whisk_recipes.extend(recipes_list)
-        
-        paging = data.get('paging', {})
-        cursors = paging.get('cursors', {})
-        next_cursor = cursors.get('after')
-        
-        if not next_cursor:
-            break 
-            
-        if not full_sync:
-            if len(all_whisk_recipes) >= limit:
-                break
-
-    logger.info(f"  -> Fetched {len(all_whisk_recipes)} recipes from Whisk.")
+    # Whisk pages are fetched in the background while earlier pages are processed
+    pages = queue.Queue(maxsize=2)
+    threading.Thread(
+        target=_fetch_pages, args=(pages, limit, full_sync, access_token),
+        name="whisk-pages", daemon=True
+    ).start()
+
+    total_fetched = 0
     processed_ids = set()
     
     # --- Process Recipes ---
-    for item in all_whisk_recipes:
-        try:
-            content = item.get('content', {})
-            collections = item.get('collections', []) # Valid for List View
-            whisk_id = content.get('id')
-            title = content.get('name') 
-            
-            if not whisk_id:
-                continue
-            
-            # --- VALIDATION PHASE 1 (List View) ---
-            is_valid, reason = validate_list_requirements(content, collections)
-            if not is_valid:
-                # Log rejection details
-                logger.warning(f"Rejecting recipe (Whisk ID: {whisk_id})")
-                logger.warning(f"  -> {reason} ('{title}')")
-                stats["rejected"] += 1
-                stats["rejection_details"].append({
-                    "id": whisk_id,
-                    "name": title or 'Unknown',
-                    "reason": reason
-                })
-                
-                add_or_update_record(
-                    whisk_recipe_id=whisk_id,
-                    notion_page_id=None,
-                    image_type=None,
-                    status="rejected",
-                    recipe_video=False,
-                    instruction_photos=False,
-                    was_made=False,
-                    recipe_title=title
-                )
-                continue
-
-            processed_ids.add(whisk_id)
-            local_record = tracker.get(whisk_id)
-            
-            notion_page_id = None
-            if local_record:
-                notion_page_id = local_record.get('notion_page_id') or local_record.get('notion_id')
-
-            # --- CHECK IF MADE? ---
-            was_made = False
-            should_check_made = True
-            if local_record and local_record.get('was_made'):
-                was_made = True
-                should_check_made = False
-
-            if should_check_made:
-                time.sleep(0.5) 
-                was_made = fetch_recipe_review_status(whisk_id, access_token=access_token)
-
-            # --- EXISTING RECIPE CHECK (Updates) ---
-            if local_record:
-                # If previously rejected but now valid in list view, treat as New
-                if local_record.get('status') == 'rejected':
-                     local_record = None # Force fall-through to Create logic
-                else:
-                    updates_performed = False
-                    recreation_triggered = False # Flag to skip other updates if recreating
-                                        
-                    # D: Instruction Photos Update (Check First: Re-create strategy)
-                    if not local_record.get('instruction_photos'):
-                        details = fetch_recipe_details(whisk_id, access_token=access_token)
-                        
-                        has_step_photos = False
-                        if details and 'recipe' in details:
-                             steps = details['recipe'].get('instructions', {}).get('steps', [])
-                             for step in steps:
-                                 if step.get('images'):
-                                     has_step_photos = True
-                                     break
-                        
-                        if has_step_photos:
-                            logger.info(f"Updating existing recipe (Whisk ID: {whisk_id})")
-                            logger.info(f"  -> Adding Instruction photos (by removing and re-creating page)...")
-                            
-                            delete_recipe_from_notion(notion_page_id, whisk_id)
-                            
-                            recipe_data = transform_whisk_to_internal(content, collections, details)
-                            
-                            added_at_ms = item.get('added_at')
-                            if added_at_ms:
-                                try:
-                                    dt = datetime.fromtimestamp(int(added_at_ms) / 1000.0)
-                                    recipe_data['date_added_iso'] = dt.isoformat()
-                                except Exception: pass
-                            
-                            if save_recipe_to_notion(recipe_data, whisk_id, was_made=was_made):
-                                 updates_performed = True
-                                 recreation_triggered = True # Don't run A/B/C
-                            else:
-                                 stats["errors"] += 1
-                                 # [NEW] Capture error
-                                 stats["error_details"].append({ "id": whisk_id, "name": title or 'Unknown', "error": "Failed to re-create page for photo update" })
-                        
-                        else:
-                            # No photos found, but we checked. 
-                            # Could update tracker to avoid re-checking, but for now we leave logic as is.
-                            pass
-
-                    # Only check A, B, C if we didn't just delete and re-create the page
-                    if not recreation_triggered:
-                        
-                        # A: Image Update
-                        if local_record.get('image_type') == 'external':
-                            logger.info(f"Updating existing recipe (Whisk ID: {whisk_id})")
-                            #logger.info(f"Replacing referenced image with uploaded image")
-                            
-                            images = content.get('images', [])
-                            img_url = images[0].get('url') if images else None
-                            
-                            if img_url and notion_page_id:
-                                if update_recipe_image_in_notion(notion_page_id, whisk_id, img_url, title):
-                                    updates_performed = True
-                                else:
-                                    stats["errors"] += 1
-                        
-                        # B: Video Update
-                        video_url = None
-                        recipe_videos = content.get('recipe_videos', [])
-                        if recipe_videos:
-                            for vid in recipe_videos:
-                                if 'youtube_video' in vid:
-                                    video_url = vid['youtube_video'].get('original_link')
-                                    break
-                                elif 'tiktok_video' in vid:
-                                    video_url = vid['tiktok_video'].get('original_link')
-                                    break
-                        
-                        if video_url and not local_record.get('recipe_video'):
-                            logger.info(f"Updating existing recipe (Whisk ID: {whisk_id})")
-                            #logger.info(f"Adding YouTube linked video to recipe")
-                            
-                            if update_recipe_video_in_notion(notion_page_id, whisk_id, video_url, title):
-                                updates_performed = True
-                            else:
-                                stats["errors"] += 1
-
-                        # C: Was Made Update
-                        local_made = local_record.get('was_made', False)
-                        if was_made and not local_made:
-                            logger.info(f"Updating existing recipe (Whisk ID: {whisk_id})")
-                            #logger.info(f"Marking recipe as 'made'")
-                        
-                            if update_recipe_made_status_in_notion(notion_page_id, whisk_id, True, title):
-                                updates_performed = True
-                            else:
-                                stats["errors"] += 1
-
-                    if updates_performed:
-                        stats["updated"] += 1
-                    else:
-                        stats["matched"] += 1
-
-            # --- NEW RECIPE ---
-            if not local_record:
-                logger.info(f"Creating new recipe (Whisk ID: {whisk_id})")
-                
-                details = fetch_recipe_details(whisk_id, access_token=access_token)
-                
-                # Phase 2 Validation (Instructions)
-                is_valid_inst, reason_inst = validate_instructions(details)
-                if not is_valid_inst:
-                    logger.warning(f"  -> Skipping Creation for {whisk_id}: {reason_inst}")
-                    stats["rejected"] += 1
-                    stats["rejection_details"].append({
-                        "id": whisk_id,
-                        "name": title or 'Unknown',
-                        "reason": reason_inst
-                    })
-                    add_or_update_record(
-                        whisk_recipe_id=whisk_id,
-                        notion_page_id=None,
-                        status="rejected",
-                        was_made=False,
-                        recipe_title=title
-                    )
-                    continue
-
-                # Transform (Scenario C)
-                recipe_data = transform_whisk_to_internal(content, collections, details)
-                
-                # Extra Safety: Check if categories were actually mapped
-                if not recipe_data['category']:
-                    logger.warning(f"  -> Skipping Creation for {whisk_id}: Missing Category")
-                    stats["rejected"] += 1
-                    stats["rejection_details"].append({
-                        "id": whisk_id,
-                        "name": title or 'Unknown',
-                        "reason": "Missing Category (Detail view mapping failed)"
-                    })
-                    add_or_update_record(
-                        whisk_recipe_id=whisk_id,
-                        notion_page_id=None,
-                        status="rejected",
-                        was_made=False,
-                        recipe_title=title
-                    )
-                    continue
-
-                added_at_ms = item.get('added_at')
-                if added_at_ms:
-                    try:
-                        dt = datetime.fromtimestamp(int(added_at_ms) / 1000.0)
-                        recipe_data['date_added_iso'] = dt.isoformat()
-                    except Exception as e:
-                        logger.warning(f"Failed to parse added_at date: {e}")
-                
-                success = save_recipe_to_notion(recipe_data, whisk_id, was_made=was_made)
-                if success: 
-                    stats["created"] += 1
-                else: 
-                    stats["errors"] += 1
-                    # [NEW] Capture error
-                    stats["error_details"].append({ "id": whisk_id, "name": title or 'Unknown', "error": "Failed to save to Notion" })
-
-        except Exception as e:
-            logger.error(f"Error processing recipe {item.get('content', {}).get('id', 'unknown')}: {e}")
-            stats["errors"] += 1
-            # [NEW] Capture exception
-            stats["error_details"].append({
-                "id": item.get('content', {}).get('id'),
-                "name": item.get('content', {}).get('name', 'Unknown'),
-                "error": str(e)
-            })
+    workers = int(os.getenv("RECIPE_SYNC_WORKERS", 5))
+    # Whisk lookups (review status, new recipe details) are fetched up front, overlapping the Notion work
+    with ThreadPoolExecutor(max_workers=10, thread_name_prefix="whisk-prefetch") as prefetch_pool, \
+         ThreadPoolExecutor(max_workers=workers, thread_name_prefix="recipe-sync") as pool:
+        futures = []
+        while (recipes_list := pages.get()) is not _PAGES_DONE:
+            if isinstance(recipes_list, Exception):
+                raise recipes_list
+            total_fetched += len(recipes_list)
+            for item in recipes_list:
+                details_future, made_future = _prefetch_whisk(item, tracker, prefetch_pool, access_token)
+                futures.append(pool.submit(_process_item, item, tracker, access_token, batch_ts, details_future, made_future))
+
+        logger.info(f"  -> Fetched {total_fetched} recipes from Whisk.")
+        # Collate on this thread only, so stats and processed_ids need no locking
+        to_create = []
+        for future in as_completed(futures):
+            whisk_id, outcome = future.result()
+            if outcome.pop("processed"):
+                processed_ids.add(whisk_id)
+            if create := outcome.pop("create"):
+                to_create.append(create)
+            for key, value in outcome.items():
+                stats[key] += value
+
+    # New pages are created together, bounded by the batch helper's concurrency
+    if to_create:
+        logger.info(f"Saving {len(to_create)} new recipes to Notion...")
+        results = save_recipes_to_notion(
+            [(recipe_data, whisk_id, was_made) for recipe_data, whisk_id, was_made, _ in to_create],
+            batch_ts=batch_ts
+        )
+        for (_, whisk_id, _, title), success in zip(to_create, results):
+            if success:
+                stats["created"] += 1
+            else:
+                stats["errors"] += 1
+                stats["error_details"].append({ "id": whisk_id, "name": title or 'Unknown', "error": "Failed to save to Notion" })
 
     # 4. Deletion (Only if Full Sync)
     if full_sync:
-        local_ids = set(tracker.keys())
-        ids_to_delete = local_ids - processed_ids
+        # One pass over the tracker; rejected records never had a page to remove
+        ids_to_delete = {
+            wid for wid, record in tracker.items()
+            if wid not in processed_ids and record.get('status') != 'rejected'
+        }
         
         if ids_to_delete:
             logger.info(f"Found {len(ids_to_delete)} recipes to remove from Notion.")
+            deletions = []
             for wid in ids_to_delete:
-                record = tracker[wid]
-                if record.get('status') == 'rejected':
-                    continue
-                    
-                page_id = record.get('notion_page_id')
-                try:
-                    if page_id:
-                        delete_recipe_from_notion(page_id, wid)
-                        stats["deleted"] += 1
-                    else:
-                        logger.warning(f"Skipping deletion for {wid}: No Page ID found.")
-                except Exception as e:
-                    logger.error(f"Error deleting {wid}: {e}")
+                page_id = tracker[wid].get('notion_page_id')
+                if page_id:
+                    deletions.append((page_id, wid))
+                else:
+                    logger.warning(f"Skipping deletion for {wid}: No Page ID found.")
+
+            # Archiving is order-independent, so it goes through the concurrent batch helper
+            stats["deleted"] += sum(delete_recipes_from_notion(deletions, concurrency=workers))
 
     # 5. Summary Log
     summary = f"""
     --------------------------------------------------
     🏁 Sync Job Complete
     --------------------------------------------------
-    Total Processed from Whisk: {len(all_whisk_recipes)}
+    Total Processed from Whisk: {total_fetched}
     Matched:      {stats['matched']}
     Updated:      {stats['updated']}
     Created:      {stats['created']}
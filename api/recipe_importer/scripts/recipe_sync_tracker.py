@@ -2,11 +2,18 @@
 Sync Tracker
 Manages the local state of recipes synced to Notion.
 File: api/recipe_importer/data/sync_status.json
+
+Records are kept in memory and only written to disk by flush_tracker(),
+so a sync run does one write instead of one per recipe.
 """
-import json
+import atexit
 import logging
+import os
 import time
 import sys
+import threading
+import orjson
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 
@@ -20,69 +27,134 @@ logger = logging.getLogger(__name__)
 DATA_DIR = Path(__file__).parent.parent / "data"
 TRACKER_FILE = DATA_DIR / "sync_status.json"
 
+# Guards the in-memory tracker when recipes are saved concurrently
+_lock = threading.Lock()
+
+# In-memory copy of the tracker file; _dirty marks unflushed changes
+_cache = None
+_cache_mtime = None
+_dirty = False
+
+# Secondary index {status: {whisk_recipe_id, ...}}, kept in step with _cache
+_by_status = defaultdict(set)
+
+class TrackerCorruptError(Exception):
+    """The tracker file exists but can't be parsed; raised instead of treating it as empty."""
+
 def _ensure_file_exists():
     if not DATA_DIR.exists():
         DATA_DIR.mkdir(parents=True, exist_ok=True)
     if not TRACKER_FILE.exists():
-        with open(TRACKER_FILE, 'w') as f:
-            json.dump({}, f)
+        TRACKER_FILE.write_bytes(b"{}")
 
-def load_tracker() -> dict:
-    """Returns the full tracker dictionary {whisk_recipe_id: record}."""
+def _read_file() -> dict:
     _ensure_file_exists()
     try:
-        with open(TRACKER_FILE, 'r') as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        return {}
+        return orjson.loads(TRACKER_FILE.read_bytes())
+    except orjson.JSONDecodeError as e:
+        # An empty dict here would make the next flush overwrite every record
+        raise TrackerCorruptError(f"Sync tracker {TRACKER_FILE} is not valid JSON: {e}") from e
+
+def _get_cache() -> dict:
+    """
+    Returns the in-memory tracker (caller holds _lock).
+    Re-reads the file if it changed on disk and there is nothing unflushed.
+    """
+    global _cache, _cache_mtime
+    _ensure_file_exists()
+    mtime = TRACKER_FILE.stat().st_mtime_ns
+    if _cache is None or (not _dirty and mtime != _cache_mtime):
+        _cache = _read_file()
+        _cache_mtime = mtime
+        _by_status.clear()
+        for whisk_id, record in _cache.items():
+            _by_status[record.get("status")].add(whisk_id)
+    return _cache
+
+def load_tracker() -> dict:
+    """Returns a snapshot of the tracker dictionary {whisk_recipe_id: record}."""
+    with _lock:
+        # Records are replaced, never mutated in place, so a shallow copy is a stable snapshot
+        return dict(_get_cache())
+
+def get_ids_by_status(status) -> list:
+    """Returns the ids of every record with the given status, without scanning the tracker."""
+    with _lock:
+        _get_cache()
+        return list(_by_status.get(status, ()))
 
 def save_tracker(data: dict):
-    """Saves the tracker dictionary to disk."""
+    """Saves the tracker dictionary to disk atomically."""
     _ensure_file_exists()
-    with open(TRACKER_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    tmp_file = TRACKER_FILE.with_suffix('.json.tmp')
+    tmp_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, TRACKER_FILE)
+
+def flush_tracker():
+    """Writes pending in-memory changes to disk. Safe to call when nothing changed."""
+    global _dirty, _cache_mtime
+    with _lock:
+        if not _dirty:
+            return
+        save_tracker(_cache)
+        _cache_mtime = TRACKER_FILE.stat().st_mtime_ns
+        _dirty = False
 
-def add_or_update_record(whisk_recipe_id, notion_page_id, image_type=None, status="new", recipe_video=None, instruction_photos=None, was_made=None, recipe_title=None):
+# Don't lose unflushed records if the process exits without an explicit flush
+atexit.register(flush_tracker)
+
+def add_or_update_record(whisk_recipe_id, notion_page_id, image_type=None, status="new", recipe_video=None, instruction_photos=None, was_made=None, recipe_title=None, content_hash=None, photos_checked_at=None):
     """
     Updates or creates a record for a recipe.
     Allows updating specific flags while preserving others if passed as None.
     """
-    data = load_tracker()
+    global _dirty
+    with _lock:
+        data = _get_cache()
     
-    # Preserve existing flags if updating
-    existing = data.get(whisk_recipe_id, {})
+        # Preserve existing flags if updating
+        existing = data.get(whisk_recipe_id, {})
     
-    # Determine values (New Value -> Existing Value -> Default)
-    final_image_type = image_type if image_type is not None else existing.get("image_type", "file_upload")
-    final_recipe_video = recipe_video if recipe_video is not None else existing.get("recipe_video", False)
-    final_instruction_photos = instruction_photos if instruction_photos is not None else existing.get("instruction_photos", False)
-    final_was_made = was_made if was_made is not None else existing.get("was_made", False)
+        # Determine values (New Value -> Existing Value -> Default)
+        final_image_type = image_type if image_type is not None else existing.get("image_type", "file_upload")
+        final_recipe_video = recipe_video if recipe_video is not None else existing.get("recipe_video", False)
+        final_instruction_photos = instruction_photos if instruction_photos is not None else existing.get("instruction_photos", False)
+        final_was_made = was_made if was_made is not None else existing.get("was_made", False)
+        final_content_hash = content_hash if content_hash is not None else existing.get("content_hash")
+        final_photos_checked_at = photos_checked_at if photos_checked_at is not None else existing.get("photos_checked_at")
     
-    # Handle Title: Sanitize if provided, otherwise keep existing or unknown
-    if recipe_title:
-        final_title = sanitize_filename(recipe_title)
-    else:
-        final_title = existing.get("recipe_title", "unknown-recipe")
-
-    record = {
-        "whisk_recipe_id": whisk_recipe_id,
-        "notion_page_id": notion_page_id,
-        "recipe_title": final_title, # [NEW] Sanitized Title
-        "image_type": final_image_type,
-        "recipe_video": final_recipe_video,
-        "instruction_photos": final_instruction_photos,
-        "was_made": final_was_made,
-        "status": status,
-        "last_synced": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    }
+        # Handle Title: Sanitize if provided, otherwise keep existing or unknown
+        if recipe_title:
+            final_title = sanitize_filename(recipe_title)
+        else:
+            final_title = existing.get("recipe_title", "unknown-recipe")
+
+        record = {
+            "whisk_recipe_id": whisk_recipe_id,
+            "notion_page_id": notion_page_id,
+            "recipe_title": final_title, # [NEW] Sanitized Title
+            "image_type": final_image_type,
+            "recipe_video": final_recipe_video,
+            "instruction_photos": final_instruction_photos,
+            "was_made": final_was_made,
+            "status": status,
+            "content_hash": final_content_hash, # Digest of the Whisk list content last seen unchanged
+            "photos_checked_at": final_photos_checked_at, # Unix seconds of the last step-photo check that found none
+            "last_synced": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
     
-    data[whisk_recipe_id] = record
-    save_tracker(data)
+        _by_status[existing.get("status")].discard(whisk_recipe_id)
+        _by_status[status].add(whisk_recipe_id)
+        data[whisk_recipe_id] = record
+        _dirty = True
 
 def remove_record(whisk_recipe_id):
     """Removes a record from the tracker."""
-    data = load_tracker()
-    if whisk_recipe_id in data:
-        del data[whisk_recipe_id]
-        save_tracker(data)
-        logger.info(f"  -> Removed {whisk_recipe_id} from sync tracker")
\ No newline at end of file
+    global _dirty
+    with _lock:
+        data = _get_cache()
+        if whisk_recipe_id in data:
+            _by_status[data[whisk_recipe_id].get("status")].discard(whisk_recipe_id)
+            del data[whisk_recipe_id]
+            _dirty = True
+            logger.info(f"  -> Removed {whisk_recipe_id} from sync tracker")
\ No newline at end of file
@@ -13,11 +13,52 @@ Upload to Whisk is handled separately by the upload endpoint.
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from urllib.parse import urlparse
 from .waitrose_scraper import scrape_waitrose_recipe
 
 logger = logging.getLogger(__name__)
 
+# Canonical Waitrose URL prefixes that need no further host validation
+_WAITROSE_PREFIXES = ('https://www.waitrose.com/', 'https://waitrose.com/')
+
+# Recently scraped recipes {normalised url: (expires_at, scraped_data)}, oldest first.
+# The same URL is often parsed twice in a row, so a warm hit skips the fetch and parse.
+SCRAPE_CACHE_TTL = 3600
+SCRAPE_CACHE_MAX = 512
+_scrape_cache = OrderedDict()
+_scrape_cache_lock = threading.Lock()
+
+
+def _cache_key(url: str) -> str:
+    """The URL minus query/fragment; canonical links are cut as a string, without urlparse."""
+    if url.startswith(_WAITROSE_PREFIXES):
+        return url.partition('?')[0].partition('#')[0]
+    return urlparse(url)._replace(query='', fragment='').geturl()
+
+
+def _cached_scrape(url: str) -> dict:
+    """scrape_waitrose_recipe with an in-process TTL cache keyed on the URL minus query/fragment."""
+    key = _cache_key(url)
+    now = time.monotonic()
+    with _scrape_cache_lock:
+        hit = _scrape_cache.get(key)
+        if hit and hit[0] > now:
+            _scrape_cache.move_to_end(key)
+            logger.info(f"Scrape cache hit for: {key}")
+            return hit[1]
+    
+    # Fetch outside the lock; failures are not cached
+    scraped_data = scrape_waitrose_recipe(url)
+    with _scrape_cache_lock:
+        _scrape_cache[key] = (now + SCRAPE_CACHE_TTL, scraped_data)
+        _scrape_cache.move_to_end(key)
+        while len(_scrape_cache) > SCRAPE_CACHE_MAX:
+            _scrape_cache.popitem(last=False)
+    return scraped_data
+
 
 def process_waitrose_recipe(url: str):
     """
@@ -43,19 +84,20 @@ def process_waitrose_recipe(url: str):
             "error": {"message": "URL is required", "body": {}}
         }
     
-    # Validate URL domain is waitrose.com
+    # Validate URL domain is waitrose.com (canonical links pass on a prefix check alone)
     try:
-        parsed_url = urlparse(url)
-        if not parsed_url.netloc.endswith('waitrose.com'):
-            logger.error(f"Invalid domain: {parsed_url.netloc}")
-            return 400, {
-                "success": False,
-                "data": None,
-                "error": {
-                    "message": "Invalid URL domain",
-                    "body": {"details": f"Only waitrose.com URLs are supported. Received: {parsed_url.netloc}"}
+        if not url.startswith(_WAITROSE_PREFIXES):
+            parsed_url = urlparse(url)
+            if not parsed_url.netloc.endswith('waitrose.com'):
+                logger.error(f"Invalid domain: {parsed_url.netloc}")
+                return 400, {
+                    "success": False,
+                    "data": None,
+                    "error": {
+                        "message": "Invalid URL domain",
+                        "body": {"details": f"Only waitrose.com URLs are supported. Received: {parsed_url.netloc}"}
+                    }
                 }
-            }
     except Exception as e:
         logger.error(f"URL parsing failed: {str(e)}")
         return 400, {
@@ -67,7 +109,7 @@ def process_waitrose_recipe(url: str):
     # Scrape the Waitrose recipe page
     try:
         logger.info(f"Scraping Waitrose recipe from: {url}")
-        scraped_data = scrape_waitrose_recipe(url)
+        scraped_data = _cached_scrape(url)
         logger.info(f"✅ Successfully scraped: {scraped_data['name']}")
         
         # Transform scraped data to frontend format
@@ -95,11 +137,11 @@ def transform_to_frontend_format(scraped_data: dict) -> dict:
     
     The scraper returns data in Whisk-like format with:
     - ingredients as list of dicts: [{"text": "...", "group": "..."}]
-    - instructions as list of strings
+    - instructions as list of dicts: [{"text": "...", "group": ...}]
     
     Frontend expects:
     - title (not name)
-    - ingredients as list of strings (for display)
+    - ingredients/instructions as {"text", "group"} objects (plain strings also accepted)
     - imageUrl (not image_url)
     - url (not source_url)
     
@@ -112,13 +154,12 @@ def transform_to_frontend_format(scraped_data: dict) -> dict:
     
     logger.info(f"Transforming scraped data for: {scraped_data.get('name')}")
     
-    # Extract ingredients text (preserve groups if present for later Whisk upload)
-    ingredients = []
-    for ing in scraped_data.get("ingredients", []):
-        if isinstance(ing, dict):
-            ingredients.append(ing["text"])
-        else:
-            ingredients.append(str(ing))
+    # Pass ingredient objects straight through so groups survive to the Whisk upload;
+    # only bare strings need wrapping
+    ingredients = [
+        ing if isinstance(ing, dict) else {"text": str(ing), "group": None}
+        for ing in scraped_data.get("ingredients", [])
+    ]
     
     # Map fields to frontend format
     frontend_data = {
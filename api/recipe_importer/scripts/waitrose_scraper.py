@@ -3,14 +3,73 @@ Waitrose Recipe Scraper
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import json
+import orjson
 import re
-from pathlib import Path
-from urllib.parse import urlparse
-from datetime import datetime
 from .ingredient_cleaner import clean_ingredient
 
+# Shared keep-alive session so repeated imports reuse the TLS connection to waitrose.com.
+# Accept-Encoding is left to requests, which adds br itself when brotli is installed.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+))
+_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml',
+})
+
+# Instruction clean-up patterns, compiled once
+_WS_RE = re.compile(r'\s+')
+_STEP_NUM_RE = re.compile(r'^\d+\.\s*')
+_SENTENCE_SPLIT_RE = re.compile(r'\.\s+(?=[A-Z])')
+_COOKS_TIP_HEADING_RE = re.compile(r"Cook['\u2019]s tip", re.IGNORECASE)
+_COOKS_TIP_PREFIX_RE = re.compile(r"^Cook['\u2019\u0027]s\s+tip\s*", re.IGNORECASE)
+
+# Hero image <source>: one CSS selector instead of a class lambda plus two nested finds
+_IMAGE_SOURCE_SELECTOR = 'div[class*="imagewrapper"] picture source:nth-of-type(2)'
+
+# ISO-8601 durations as used in the JSON-LD prepTime/cookTime, e.g. PT1H30M, PT30M0S, P0DT1H30M.
+# Time parts need the T, so P1M (a month) doesn't read as a minute.
+_DUR_RE = re.compile(r'^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+
+# JSON-LD <script> blocks, matched on the raw response bytes before any HTML parse
+_JSONLD_RE = re.compile(rb'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+
+def _find_recipe_schema(content: bytes):
+    """Returns the first JSON-LD object with @type 'Recipe' (top level, list or @graph), or None."""
+    for m in _JSONLD_RE.finditer(content):
+        try:
+            data = orjson.loads(m.group(1))
+        except orjson.JSONDecodeError:
+            continue
+        if isinstance(data, dict):
+            candidates = data.get('@graph', [data])
+        elif isinstance(data, list):
+            candidates = data
+        else:
+            continue
+        for item in candidates:
+            if isinstance(item, dict) and item.get('@type') == 'Recipe':
+                return item
+    return None
+
+def _parse_duration(duration_str):
+    """ISO-8601 duration -> total whole minutes (days folded into hours), or None if missing, zero or unparseable."""
+    m = duration_str and _DUR_RE.match(duration_str)
+    if not m:
+        return None
+    days, hours, mins, _secs = (int(g) if g else 0 for g in m.groups())
+    total = (days * 24 + hours) * 60 + mins
+    return total or None
+
+# The only tags parse_ingredients_from_html acts on
+_INGREDIENT_WALK_TAGS = frozenset(('h2', 'h3', 'h4', 'ul'))
+
 def parse_ingredients_from_html(soup):
     """
     Parse ingredients from the HTML ingredient list with group support.
@@ -22,9 +81,12 @@ def parse_ingredients_from_html(soup):
     if not ingredients_heading:
         return ingredients
     
-    current = ingredients_heading.find_next()
-    
-    while current:
+    # One forward pass over the nodes after the heading, stopping at the Method h2.
+    # (Not bounded to the heading's parent: the lists don't always share its container.)
+    for current in ingredients_heading.next_elements:
+        if current.name not in _INGREDIENT_WALK_TAGS:
+            continue
+        
         if current.name == 'h2' and 'method' in current.get_text().lower():
             break
         
@@ -45,47 +107,27 @@ def parse_ingredients_from_html(soup):
                          current_group = "For" + current_group[3:]
 
         elif current.name == 'ul':
-            for li in current.find_all('li', recursive=False):
-                raw_text = li.get_text(separator=' ', strip=True)
-                cleaned_text = clean_ingredient(raw_text)
-                
-                if cleaned_text:
-                    ing_dict = {"text": cleaned_text, "group": current_group}
-                    ingredients.append(ing_dict)
-        
-        current = current.find_next()
+            texts = [clean_ingredient(li.get_text(separator=' ', strip=True)) for li in current.find_all('li', recursive=False)]
+            ingredients.extend({"text": text, "group": current_group} for text in texts if text)
     
     return ingredients
 
 def scrape_waitrose_recipe(url: str) -> dict:
-    # ... (Headers and request logic remains the same) ...
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     try:
-        response = requests.get(url, timeout=10, headers=headers)
+        response = _session.get(url, timeout=10)
         response.raise_for_status()
     except Exception as e:
         raise Exception(f"Failed to fetch recipe: {str(e)}")
     
-    soup = BeautifulSoup(response.content, 'html.parser')
-    
-    # ... (JSON-LD extraction remains the same) ...
-    json_ld_scripts = soup.find_all('script', type='application/ld+json')
-    schema_data = None
-    for script in json_ld_scripts:
-        try:
-            data = json.loads(script.string)
-            if data.get('@type') == 'Recipe':
-                schema_data = data
-                break
-        except json.JSONDecodeError:
-            continue
-            
+    # Only the Recipe JSON-LD is needed from the scripts, so pull it straight from the bytes
+    schema_data = _find_recipe_schema(response.content)
     if not schema_data:
         raise Exception("No recipe schema found on page")
     
+    # lxml (libxml2) parses far faster than html.parser; raw bytes let it detect the encoding itself.
+    # The tree is still needed for ingredients, cook's tips and the image.
+    soup = BeautifulSoup(response.content, 'lxml')
+    
     recipe_data = {}
     
     # ... (Basic info parsing remains the same) ...
@@ -93,22 +135,8 @@ def scrape_waitrose_recipe(url: str) -> dict:
     recipe_data['servings'] = schema_data.get('recipeYield')
     recipe_data['description'] = schema_data.get('description', '')
     
-    # Duration parsing logic (same as before)
-    def parse_duration(duration_str):
-        if not duration_str: return None
-        duration_str = duration_str.replace('PT', '')
-        hours = 0
-        mins = 0
-        if 'H' in duration_str:
-            parts = duration_str.split('H')
-            hours = int(parts[0])
-            duration_str = parts[1] if len(parts) > 1 else ''
-        if 'M' in duration_str:
-            mins = int(duration_str.replace('M', ''))
-        return (hours * 60) + mins if (hours or mins) else None
-
-    recipe_data['prep_time'] = parse_duration(schema_data.get('prepTime', ''))
-    recipe_data['cook_time'] = parse_duration(schema_data.get('cookTime', ''))
+    recipe_data['prep_time'] = _parse_duration(schema_data.get('prepTime', ''))
+    recipe_data['cook_time'] = _parse_duration(schema_data.get('cookTime', ''))
     
     if recipe_data['prep_time'] is not None and recipe_data['cook_time'] is not None:
         recipe_data['total_time'] = recipe_data['prep_time'] + recipe_data['cook_time']
@@ -128,6 +156,7 @@ def scrape_waitrose_recipe(url: str) -> dict:
     
     # 1. Main Instructions (from JSON-LD usually, assume group=None)
     instructions_raw = schema_data.get('recipeInstructions', [])
+    append_instruction = recipe_data['instructions'].append
     for step in instructions_raw:
         text = ''
         if isinstance(step, dict):
@@ -135,24 +164,21 @@ def scrape_waitrose_recipe(url: str) -> dict:
         else:
             text = step
         
-        text = text.replace('\r\n', ' ').replace('\n', ' ')
-        text = re.sub(r'\s+', ' ', text).strip()
-        text = re.sub(r'^\d+\.\s*', '', text)
+        # \s+ already covers \r\n and \n, so one sub normalises all whitespace
+        text = _STEP_NUM_RE.sub('', _WS_RE.sub(' ', text).strip())
         
         if text:
-            sentences = re.split(r'\.\s+(?=[A-Z])', text)
-            for sentence in sentences:
+            for sentence in _SENTENCE_SPLIT_RE.split(text):
                 sentence = sentence.strip()
-                if sentence and not sentence[-1] in '.!?':
-                    sentence += '.'
                 if sentence:
-                    # Append as dict
-                    recipe_data['instructions'].append({"text": sentence, "group": None})
+                    if sentence[-1] not in '.!?':
+                        sentence += '.'
+                    append_instruction({"text": sentence, "group": None})
 
     # 2. Cook's Tips (Add as instructions with group="Cook's tip")
     cooks_tip_section = soup.find(
         ['h3', 'h4'], 
-        string=re.compile(r"Cook['\u2019]s tip", re.IGNORECASE)
+        string=_COOKS_TIP_HEADING_RE
     )
     if cooks_tip_section:
         for sibling in cooks_tip_section.find_next_siblings():
@@ -161,23 +187,19 @@ def scrape_waitrose_recipe(url: str) -> dict:
             if sibling.name == 'p':
                 text = sibling.get_text(strip=True)
                 if text:
-                    text = re.sub(r"^Cook['\u2019\u0027]s\s+tip\s*", '', text, flags=re.IGNORECASE)
+                    text = _COOKS_TIP_PREFIX_RE.sub('', text)
                     text = text.strip()
                     if text:
                         recipe_data['instructions'].append({"text": text, "group": "Cook's tip"})
 
-    # Extract image (same as before)
-    image_wrapper = soup.find('div', class_=lambda x: x and 'imagewrapper' in x)
-    if image_wrapper:
-        picture_tag = image_wrapper.find('picture')
-        if picture_tag:
-            source_tags = picture_tag.find_all('source')
-            if len(source_tags) >= 2:
-                srcset = source_tags[1].get('srcset')
-                if srcset:
-                    images = srcset.split(',')
-                    last_image = images[-1].strip()
-                    recipe_data['image_url'] = last_image.split()[0]
+    # Extract image: the second <source> of the hero picture carries the full-size srcset
+    source_tag = soup.select_one(_IMAGE_SOURCE_SELECTOR)
+    if source_tag:
+        srcset = source_tag.get('srcset')
+        if srcset:
+            images = srcset.split(',')
+            last_image = images[-1].strip()
+            recipe_data['image_url'] = last_image.split()[0]
     
     recipe_data['source_url'] = url
     
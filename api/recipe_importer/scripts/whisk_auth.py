@@ -5,6 +5,7 @@ Whisk Authentication Module
 import json
 import time
 import os
+import threading
 import requests
 from pathlib import Path
 import logging
@@ -24,6 +25,14 @@ WHISK_CLIENT_ID = os.getenv("WHISK_CLIENT_ID", "")
 WHISK_EMAIL = os.getenv("WHISK_EMAIL", "")
 WHISK_PASSWORD = os.getenv("WHISK_PASSWORD", "")
 
+# Refresh this many seconds before the recorded expiry
+TOKEN_EXPIRY_MARGIN = 60
+
+# In-memory copy of the token file so sync workers don't re-read it on every call.
+# The lock also stops concurrent workers from all logging in at once.
+_token_cache = {"access_token": None, "expires_at": 0}
+_token_lock = threading.Lock()
+
 def save_token(token_data: dict):
     TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(TOKEN_FILE, "w") as f:
@@ -62,6 +71,7 @@ def login_with_token(email: str, password: str, anon_token: str) -> tuple[str, s
     expires_at = time.time() + expires_in
 
     save_token({"access_token": access_token, "expires_at": expires_at})
+    _token_cache.update(access_token=access_token, expires_at=expires_at)
     logger.info("  -> New token acquired and saved.")
     return access_token, "refreshed"
 
@@ -69,19 +79,28 @@ def refresh_token_if_needed(email: str, password: str) -> tuple[str, str]:
     anon_token, _ = get_anonymous_token()
     return login_with_token(email, password, anon_token)
 
-def get_access_token() -> dict:
+def _is_fresh(token_data: dict, rejected_token: str | None = None) -> bool:
+    token = token_data.get("access_token")
+    return bool(token) and token != rejected_token and time.time() < token_data.get("expires_at", 0) - TOKEN_EXPIRY_MARGIN
+
+def get_access_token(rejected_token: str | None = None) -> dict:
     """
     Main authentication function.
-    Returns: {'access_token': '...', 'source': 'stored'|'refreshed'}
+    Serves the in-memory token while it is fresh, then the token file, then logs in.
+    rejected_token is the token a request just got a 401 for: it is never served again,
+    but if another caller has already replaced it the newer token is reused instead of logging in again.
+    Returns: {'access_token': '...', 'source': 'cached'|'stored'|'refreshed'}
     """
-    token_data = load_token()
-    access_token = token_data.get("access_token")
-    expires_at = token_data.get("expires_at", 0)
-    
-    if access_token and time.time() < expires_at:
-        logger.info("  -> Using valid stored token.")
-        return {"access_token": access_token, "source": "stored"}
-    else:
+    with _token_lock:
+        if _is_fresh(_token_cache, rejected_token):
+            return {"access_token": _token_cache["access_token"], "source": "cached"}
+
+        token_data = load_token()
+        if _is_fresh(token_data, rejected_token):
+            logger.info("  -> Using valid stored token.")
+            _token_cache.update(access_token=token_data["access_token"], expires_at=token_data["expires_at"])
+            return {"access_token": token_data["access_token"], "source": "stored"}
+
         logger.info("  -> Token missing or expired. Authenticating...")
         new_token, source = refresh_token_if_needed(WHISK_EMAIL, WHISK_PASSWORD)
-        return {"access_token": new_token, "source": source}
\ No newline at end of file
+        return {"access_token": new_token, "source": source}
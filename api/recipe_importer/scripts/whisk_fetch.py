@@ -4,13 +4,34 @@ Handles fetching recipes from Whisk for synchronization.
 """
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from notion_handlers.rate_limiter import TokenBucket
 from .whisk_auth import get_access_token
 
 logger = logging.getLogger("whisk_importer")
 
+# Shared keep-alive session for all Whisk API calls.
+# Transient 429/5xx responses are retried by urllib3 (honouring Retry-After);
+# raise_on_status=False hands the last response back so raise_for_status still applies.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+))
+
+# Paces every Whisk API call (list, details, review status) across all sync threads:
+# short bursts go straight through, sustained traffic settles at ~2 req/sec
+whisk_limiter = TokenBucket(rate=2, capacity=5)
+
+# Tokens Whisk has answered with a 401. Callers such as run_sync keep passing the token
+# they started with, so once it is in here the current shared token is used instead.
+_rejected_tokens = set()
+
 def _get_token_if_missing(access_token):
-    """Helper to get token if not provided."""
-    if access_token:
+    """Helper to get token if not provided (or if the one provided has since been rejected)."""
+    if access_token and access_token not in _rejected_tokens:
         return access_token
         
     token_data = get_access_token()
@@ -23,7 +44,8 @@ def _make_request_with_retry(method, url, headers, params=None):
     Executes a request and refreshes the token on 401 Unauthorized.
     """
     try:
-        response = requests.request(method, url, headers=headers, params=params)
+        whisk_limiter.acquire()
+        response = _session.request(method, url, headers=headers, params=params)
         response.raise_for_status()
         return response
     except requests.HTTPError as e:
@@ -31,16 +53,19 @@ def _make_request_with_retry(method, url, headers, params=None):
         if e.response.status_code == 401:
             logger.warning("⚠️ Whisk Token expired (401). Refreshing...")
             
-            # Force a fresh token fetch
-            # Note: get_access_token handles the login flow
-            new_token_data = get_access_token()
+            # Hand back the token that was rejected: get_access_token only logs in again
+            # if no other request has replaced it yet
+            rejected_token = headers.get("Authorization", "").removeprefix("Bearer ")
+            _rejected_tokens.add(rejected_token)
+            new_token_data = get_access_token(rejected_token=rejected_token)
             if new_token_data and new_token_data.get('access_token'):
                 new_token = new_token_data['access_token']
                 headers["Authorization"] = f"Bearer {new_token}"
                 
                 # Retry
                 logger.info("🔄 Retrying with new token...")
-                response = requests.request(method, url, headers=headers, params=params)
+                whisk_limiter.acquire()
+                response = _session.request(method, url, headers=headers, params=params)
                 response.raise_for_status()
                 return response
             else: